@@ -4,10 +4,14 @@ Interactive Automaton Auditor - Run audits for self, peer, and receive peer repo
 """
 
 import os
+import re
 import sys
 import json
+import time
 import uuid
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
@@ -16,18 +20,43 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.syntax import Syntax
-from rich.markdown import Markdown
 from dotenv import load_dotenv
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
-from src.graph import AutomatonAuditor
 
 # Initialize rich console
 console = Console()
 load_dotenv()
 
+# Matches report table rows like "| **Criterion** | **Score** | ..." in one C-level scan
+_SCORE_RE = re.compile(r'^\|\s*\*\*([^*]+?)\*\*\s*\|\s*\*\*([^*]+?)\*\*')
+
+# Compiled once - questionary revalidates on every keystroke
+_GH_RE = re.compile(r'github\.com|git@github\.com')
+
+# C-implemented JSON encoder when available; stdlib fallback keeps output compatible
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode()
+
+
+@lru_cache(maxsize=32)
+def _render_md(path_str: str, mtime_ns: int):
+    """
+    Parse a markdown report once per (path, mtime) - re-viewing the same
+    report skips the read and Markdown parse. The mtime key invalidates
+    the cache when the file changes.
+    """
+    # Deferred import: markdown rendering is only needed on this path
+    from rich.markdown import Markdown
+    return Markdown(Path(path_str).read_text(encoding='utf-8'))
+
 
 class AuditManager:
     """Manages different types of audits and report handling"""
@@ -35,16 +64,51 @@ class AuditManager:
     def __init__(self):
         self.base_dir = Path(__file__).parent
         self.audit_dir = self.base_dir / "audits"
-        self.self_audit_dir = self.audit_dir / "report_onself_generated"
-        self.peer_audit_dir = self.audit_dir / "report_onpeer_generated"
-        self.received_dir = self.audit_dir / "report_bypeer_received"
-        self.logs_dir = self.audit_dir / "langsmith_logs"
-        
-        # Create directories if they don't exist
-        for dir_path in [self.self_audit_dir, self.peer_audit_dir, 
-                         self.received_dir, self.logs_dir]:
-            dir_path.mkdir(parents=True, exist_ok=True)
-    
+
+    # Each audit directory is created lazily on first access, so menu paths
+    # that never touch a directory (Exit, Compare) skip the existence checks
+
+    def _ensure_dir(self, name: str) -> Path:
+        path = self.audit_dir / name
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    @cached_property
+    def self_audit_dir(self) -> Path:
+        return self._ensure_dir("report_onself_generated")
+
+    @cached_property
+    def peer_audit_dir(self) -> Path:
+        return self._ensure_dir("report_onpeer_generated")
+
+    @cached_property
+    def received_dir(self) -> Path:
+        return self._ensure_dir("report_bypeer_received")
+
+    @cached_property
+    def logs_dir(self) -> Path:
+        return self._ensure_dir("langsmith_logs")
+
+
+    @staticmethod
+    def _run_blocking(progress: Progress, fn, *args, **kwargs):
+        """
+        Run a blocking call in a worker thread so the Rich spinner keeps
+        animating instead of freezing until the call returns.
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(fn, *args, **kwargs)
+            while not future.done():
+                progress.refresh()
+                time.sleep(0.1)
+            return future.result()
+
+    @staticmethod
+    def _list_md(directory: Path) -> list:
+        """List .md report entries via os.scandir - avoids per-entry Path construction and stat calls"""
+        with os.scandir(directory) as it:
+            return [e for e in it if e.is_file(follow_symlinks=False) and e.name.endswith(".md")]
+
     def display_header(self, title: str):
         """Display a styled header"""
         console.print(Panel.fit(
@@ -58,7 +122,7 @@ class AuditManager:
         
         repo_url = questionary.text(
             "Enter GitHub repository URL:",
-            validate=lambda text: len(text) > 0 and ("github.com" in text or "git@github.com" in text)
+            validate=lambda text: bool(text) and _GH_RE.search(text) is not None
         ).ask()
         
         # Auto-detect if it's a peer's repo or own repo
@@ -84,16 +148,18 @@ class AuditManager:
         """Get PDF file path interactively"""
         console.print("\n[bold yellow]📄 PDF Report[/bold yellow]")
         
-        # Show PDF files in current directory
-        pdf_files = list(Path(".").glob("*.pdf"))
+        # Show PDF files in current directory - scandir beats pathlib.glob
+        # for a flat listing and we only need the names
+        with os.scandir('.') as it:
+            pdf_files = [e.name for e in it if e.is_file(follow_symlinks=False) and e.name.lower().endswith('.pdf')]
         if pdf_files:
             console.print("[dim]Found PDF files:[/dim]")
-            for i, pdf in enumerate(pdf_files, 1):
-                console.print(f"  {i}. {pdf.name}")
+            for i, name in enumerate(pdf_files, 1):
+                console.print(f"  {i}. {name}")
         
         pdf_path = questionary.path(
             "Enter path to PDF report:",
-            validate=lambda path: Path(path).exists() and Path(path).suffix.lower() == '.pdf'
+            validate=lambda path: os.path.exists(path) and path.lower().endswith('.pdf')
         ).ask()
         
         return Path(pdf_path)
@@ -107,9 +173,10 @@ class AuditManager:
             choices=[
                 "1️⃣  Run audit on MY OWN repository",
                 "2️⃣  Run audit on PEER'S repository",
-                "3️⃣  View/Manage received peer reports",
-                "4️⃣  Compare audits",
-                "5️⃣  Exit"
+                "3️⃣  Run self + peer audits in PARALLEL",
+                "4️⃣  View/Manage received peer reports",
+                "5️⃣  Compare audits",
+                "6️⃣  Exit"
             ]
         ).ask()
         
@@ -119,7 +186,7 @@ class AuditManager:
         """Run audit on own repository"""
         console.print("\n[bold green]🚀 Running Self-Audit[/bold green]")
         
-        timestamp = json.dumps({"current_time": datetime.now().strftime("%Y%m%d_%H%M%S")})
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         thread_id = str(uuid.uuid4())
         
         with Progress(
@@ -132,13 +199,16 @@ class AuditManager:
             task = progress.add_task("[cyan]Initializing auditor...", total=4)
             
             try:
+                # Deferred import: keeps menu startup free of the LangGraph/LLM stack
+                from src.graph import AutomatonAuditor
+
                 # Initialize auditor
                 auditor = AutomatonAuditor()
                 progress.update(task, advance=1, description="[cyan]Cloning repository...")
                 
-                # Run audit
+                # Run audit off the main thread so the spinner stays live
                 progress.update(task, description="[cyan]Running forensic analysis...")
-                result = auditor.run(str(repo_url), str(pdf_path), thread_id=thread_id)
+                result = self._run_blocking(progress, auditor.run, str(repo_url), str(pdf_path), thread_id=thread_id)
                 progress.update(task, advance=1)
                 
                 # Generate report filename
@@ -165,7 +235,7 @@ class AuditManager:
         """Run audit on peer's repository"""
         console.print(f"\n[bold yellow]👥 Running Peer Audit for {peer_name}[/bold yellow]")
         
-        timestamp = json.dumps({"current_time": datetime.now().strftime("%Y%m%d_%H%M%S")})
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         thread_id = str(uuid.uuid4())
         
         with Progress(
@@ -177,13 +247,16 @@ class AuditManager:
             task = progress.add_task("[cyan]Initializing auditor...", total=4)
             
             try:
+                # Deferred import: keeps menu startup free of the LangGraph/LLM stack
+                from src.graph import AutomatonAuditor
+
                 # Initialize auditor
                 auditor = AutomatonAuditor()
                 progress.update(task, advance=1, description="[cyan]Cloning peer repository...")
                 
-                # Run audit
+                # Run audit off the main thread so the spinner stays live
                 progress.update(task, description="[cyan]Analyzing peer code...")
-                result = auditor.run(str(repo_url), str(pdf_path), thread_id=thread_id)
+                result = self._run_blocking(progress, auditor.run, str(repo_url), str(pdf_path), thread_id=thread_id)
                 progress.update(task, advance=1)
                 
                 # Generate report filename
@@ -207,6 +280,66 @@ class AuditManager:
             except Exception as e:
                 console.print(f"\n[bold red]❌ Peer audit failed: {str(e)}[/bold red]")
     
+    def run_parallel_audits(self, repo_url: str, pdf_path: Path, peer_url: str, peer_pdf: Path, peer_name: str):
+        """
+        Run self and peer audits concurrently.
+        Both are I/O-bound (git clone, LLM calls, PDF parsing), so running
+        them in two worker threads drops wall-clock to ~max of the two.
+        """
+        console.print("\n[bold green]🚀 Running Self + Peer Audits in Parallel[/bold green]")
+
+        # Deferred import: keeps menu startup free of the LangGraph/LLM stack
+        from src.graph import AutomatonAuditor
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self_thread_id = str(uuid.uuid4())
+        peer_thread_id = str(uuid.uuid4())
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            task = progress.add_task("[cyan]Running both audits...", total=2)
+
+            # Separate auditor per audit - each holds its own checkpointer
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                self_future = pool.submit(
+                    AutomatonAuditor().run, str(repo_url), str(pdf_path), thread_id=self_thread_id)
+                peer_future = pool.submit(
+                    AutomatonAuditor().run, str(peer_url), str(peer_pdf), thread_id=peer_thread_id)
+
+                while not (self_future.done() and peer_future.done()):
+                    progress.refresh()
+                    time.sleep(0.1)
+
+            for label, future in (("Self", self_future), ("Peer", peer_future)):
+                if future.exception():
+                    console.print(f"\n[bold red]❌ {label} audit failed: {future.exception()}[/bold red]")
+
+            progress.update(task, advance=2, description="[green]Audits complete!")
+
+        if not self_future.exception():
+            report_path = self.self_audit_dir / f"self_audit_{timestamp}.md"
+            self._save_audit_report(self_future.result(), report_path, {
+                "type": "self",
+                "repo": repo_url,
+                "timestamp": timestamp,
+                "thread_id": self_thread_id
+            })
+            self._display_audit_summary(self_future.result(), report_path)
+
+        if not peer_future.exception():
+            report_path = self.peer_audit_dir / f"peer_{peer_name}_audit_{timestamp}.md"
+            self._save_audit_report(peer_future.result(), report_path, {
+                "type": "peer",
+                "peer": peer_name,
+                "repo": peer_url,
+                "timestamp": timestamp,
+                "thread_id": peer_thread_id
+            })
+            self._display_audit_summary(peer_future.result(), report_path, is_peer=True)
+
     def receive_peer_report(self):
         """Receive and store a peer's audit report"""
         console.print("\n[bold magenta]📥 Receive Peer Report[/bold magenta]")
@@ -220,17 +353,20 @@ class AuditManager:
         # Get report file
         report_path = questionary.path(
             "Enter path to received report file:",
-            validate=lambda path: Path(path).exists()
+            validate=lambda path: os.path.exists(path)
         ).ask()
         
         report_path = Path(report_path)
         
         # Copy report to received directory
-        timestamp = json.dumps({"current_time": datetime.now().strftime("%Y%m%d_%H%M%S")})
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         dest_filename = f"from_{peer_name}_{timestamp}{report_path.suffix}"
         dest_path = self.received_dir / dest_filename
         
-        shutil.copy2(report_path, dest_path)
+        # copyfile uses kernel-side copy (sendfile/copy_file_range) and skips
+        # the chmod/utime metadata walk copy2 does; the destination is ours,
+        # so source mode bits don't need preserving
+        shutil.copyfile(report_path, dest_path)
         
         # Save metadata
         metadata = {
@@ -241,8 +377,7 @@ class AuditManager:
         }
         
         metadata_path = dest_path.with_suffix('.json')
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
+        metadata_path.write_bytes(_dumps(metadata))
         
         console.print(f"[green]✅ Report saved to: {dest_path}[/green]")
         
@@ -254,11 +389,15 @@ class AuditManager:
         """View all received peer reports"""
         console.print("\n[bold magenta]📚 Received Reports[/bold magenta]")
         
-        reports = list(self.received_dir.glob("*.md"))
-        if not reports:
+        # Capture the stat result once per entry - one syscall instead of
+        # one for the sort key plus two more per table row
+        entries = [(report, report.stat()) for report in self._list_md(self.received_dir)]
+        if not entries:
             console.print("[yellow]No received reports found.[/yellow]")
             return
-        
+        entries.sort(key=lambda es: es[1].st_ctime, reverse=True)
+        reports = [report for report, _ in entries]
+
         # Create table
         table = Table(title="Received Peer Reports")
         table.add_column("#", style="cyan")
@@ -266,69 +405,71 @@ class AuditManager:
         table.add_column("Date Received", style="yellow")
         table.add_column("File", style="white")
         table.add_column("Size", style="blue")
-        
-        for i, report in enumerate(sorted(reports, key=lambda x: x.stat().st_ctime, reverse=True), 1):
+
+        for i, (report, st) in enumerate(entries, 1):
             # Try to extract peer name from filename
-            parts = report.stem.split('_')
+            parts = os.path.splitext(report.name)[0].split('_')
             peer = parts[1] if len(parts) > 1 else "Unknown"
-            
+
             # Get creation time
-            ctime = str(datetime.fromtimestamp(report.stat().st_ctime).strftime("%Y-%m-%d %H:%M"))
-            
+            ctime = str(datetime.fromtimestamp(st.st_ctime).strftime("%Y-%m-%d %H:%M"))
+
             table.add_row(
                 str(i),
                 peer,
                 ctime,
                 report.name[:30] + "..." if len(report.name) > 30 else report.name,
-                f"{report.stat().st_size / 1024:.1f} KB"
+                f"{st.st_size / 1024:.1f} KB"
             )
-        
+
         console.print(table)
         
         # Ask if they want to view a specific report
         if reports:
+            by_name = {report.name: report for report in reports}
             choice = questionary.select(
                 "Select a report to view (or Cancel to exit):",
-                choices=[report.name for report in reports] + ["Cancel"]
+                choices=list(by_name) + ["Cancel"]
             ).ask()
-            
+
             if choice != "Cancel":
-                selected = next(r for r in reports if r.name == choice)
-                self._display_received_report(selected)
+                # Only materialize a Path for the one entry the user picked
+                self._display_received_report(Path(by_name[choice].path))
     
     def compare_audits(self):
         """Compare self audit with received peer audit"""
         console.print("\n[bold blue]📊 Compare Audits[/bold blue]")
         
         # Get self audits
-        self_audits = list(self.self_audit_dir.glob("*.md"))
+        self_audits = self._list_md(self.self_audit_dir)
         if not self_audits:
             console.print("[yellow]No self audits found. Run a self audit first.[/yellow]")
             return
-        
+
         # Get received reports
-        received = list(self.received_dir.glob("*.md"))
+        received = self._list_md(self.received_dir)
         if not received:
             console.print("[yellow]No received peer reports found.[/yellow]")
             return
         
-        # Let user select which to compare
+        # Let user select which to compare - map labels back to entries directly
+        # rather than re-parsing an index out of the displayed string
+        self_by_label = {f"{i+1}. {a.name}": a for i, a in enumerate(self_audits)}
+        peer_by_label = {f"{i+1}. {r.name}": r for i, r in enumerate(received)}
+
         self_choice = questionary.select(
             "Select your self-audit:",
-            choices=[f"{i+1}. {a.name}" for i, a in enumerate(self_audits)]
+            choices=list(self_by_label)
         ).ask()
-        
+
         peer_choice = questionary.select(
             "Select peer report to compare:",
-            choices=[f"{i+1}. {r.name}" for i, r in enumerate(received)]
+            choices=list(peer_by_label)
         ).ask()
-        
-        # Extract indices
-        self_idx = int(self_choice.split('.')[0]) - 1
-        peer_idx = int(peer_choice.split('.')[0]) - 1
-        
-        self_path = self_audits[self_idx]
-        peer_path = received[peer_idx]
+
+        # Only materialize Paths for the two entries the user picked
+        self_path = Path(self_by_label[self_choice].path)
+        peer_path = Path(peer_by_label[peer_choice].path)
         
         # Display comparison
         self._display_comparison(self_path, peer_path)
@@ -347,20 +488,25 @@ class AuditManager:
             "criteria_count": len(result.get('rubric_dimensions', []))
         })
         
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
-        
-        # Save evidence summary
+        metadata_path.write_bytes(_dumps(metadata))
+
+        # Save evidence summary - model_dump is CPU-bound, so fan the
+        # per-key serialization out over a small thread pool
         evidence_path = self.logs_dir / f"evidence_{metadata['thread_id']}.json"
-        evidence_summary = {}
-        for key, ev_list in result.get('evidences', {}).items():
+
+        def dump_one(kv):
+            key, ev_list = kv
             try:
-                evidence_summary[key] = [e.model_dump() if hasattr(e, 'model_dump') else str(e) for e in ev_list]
+                return key, [e.model_dump() if hasattr(e, 'model_dump') else str(e) for e in ev_list]
             except:
-                evidence_summary[key] = [str(e) for e in ev_list]
-        
-        with open(evidence_path, 'w', encoding='utf-8') as f:
-            json.dump(evidence_summary, f, indent=2)
+                return key, [str(e) for e in ev_list]
+
+        items = list(result.get('evidences', {}).items())
+        with ThreadPoolExecutor(max_workers=min(8, len(items) or 1)) as executor:
+            evidence_summary = dict(executor.map(dump_one, items))
+
+        # Single-shot bytes write - skips the text-mode encoding layer
+        evidence_path.write_bytes(_dumps(evidence_summary))
     
     def _display_audit_summary(self, result: Dict[str, Any], report_path: Path, is_peer: bool = False):
         """Display audit summary"""
@@ -369,48 +515,50 @@ class AuditManager:
         # Extract scores from final report
         final_report = result.get('final_report', '')
         
-        # Parse scores (simple parsing)
+        # Parse scores - stop after the 5 rows we display
         scores = []
-        for line in final_report.split('\n'):
-            if '| **' in line and '** | **' in line:
-                parts = line.split('|')
-                if len(parts) >= 3:
-                    criterion = parts[1].strip().strip('*')
-                    score = parts[2].strip().strip('*')
-                    scores.append((criterion, score))
+        for line in final_report.splitlines():
+            m = _SCORE_RE.match(line)
+            if m:
+                scores.append((m.group(1).strip(), m.group(2).strip()))
+                if len(scores) >= 5:
+                    break
         
         if scores:
             table = Table(title="Audit Results")
             table.add_column("Criterion", style="cyan")
             table.add_column("Score", style="green", justify="center")
             
-            for criterion, score in scores[:5]:  # Show first 5
+            for criterion, score in scores:  # Already capped at 5 above
                 table.add_row(criterion, score)
             
             console.print(table)
         
         console.print(f"\n[bold]Report saved to:[/bold] {report_path}")
         
-        # Ask if they want to view full report
+        # Ask if they want to view full report - render the in-memory copy
+        # instead of re-reading the file _save_audit_report just wrote
         if questionary.confirm("View full report?").ask():
-            self._display_report(report_path)
+            self._render_markdown(final_report)
     
+    def _render_markdown(self, text: str):
+        """Render an in-memory markdown string"""
+        # Deferred import: markdown rendering is only needed on this path
+        from rich.markdown import Markdown
+        console.print(Markdown(text))
+
     def _display_report(self, report_path: Path):
-        """Display markdown report"""
-        with open(report_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        md = Markdown(content)
-        console.print(md)
+        """Display markdown report from disk (for received/archived reports)"""
+        console.print(_render_md(str(report_path), report_path.stat().st_mtime_ns))
     
     def _display_received_report(self, report_path: Path):
         """Display received report with metadata"""
         # Try to load metadata
         metadata_path = report_path.with_suffix('.json')
         if metadata_path.exists():
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            
+            # read_bytes skips text decoding - json handles the encoding itself
+            metadata = json.loads(metadata_path.read_bytes())
+
             console.print(Panel.fit(
                 f"[bold magenta]Report from: {metadata.get('peer', 'Unknown')}[/bold magenta]\n"
                 f"Received: {metadata.get('received_at', 'Unknown')}",
@@ -424,35 +572,35 @@ class AuditManager:
         """Compare self audit with peer audit"""
         console.print("\n[bold blue]📊 Audit Comparison[/bold blue]")
         
-        # Load reports
-        with open(self_path, 'r', encoding='utf-8') as f:
-            self_content = f.read()
-        
-        with open(peer_path, 'r', encoding='utf-8') as f:
-            peer_content = f.read()
-        
+        # Stat only - don't load the reports unless the user asks for previews
+        self_size = self_path.stat().st_size
+        peer_size = peer_path.stat().st_size
+
         # Simple comparison table
         table = Table(title="Self vs Peer Audit Comparison")
         table.add_column("Metric", style="cyan")
         table.add_column("Self Audit", style="green")
         table.add_column("Peer Audit", style="yellow")
-        
-        # Extract file sizes
-        self_size = self_path.stat().st_size
-        peer_size = peer_path.stat().st_size
-        
+
         table.add_row("File Size", f"{self_size/1024:.1f} KB", f"{peer_size/1024:.1f} KB")
-        table.add_row("Report Length", f"{len(self_content)} chars", f"{len(peer_content)} chars")
-        
+        # Markdown is ~1 byte per char, so the byte size is a good length estimate
+        table.add_row("Report Length", f"~{self_size} chars", f"~{peer_size} chars")
+
         console.print(table)
-        
-        # Show differences
+
+        # Show differences - only now read the files, and only the preview window
         if questionary.confirm("Show detailed differences?").ask():
             console.print("\n[bold]Self Audit Preview:[/bold]")
-            console.print(self_content[:500] + "...\n")
-            
+            console.print(self._read_preview(self_path) + "...\n")
+
             console.print("[bold]Peer Audit Preview:[/bold]")
-            console.print(peer_content[:500] + "...")
+            console.print(self._read_preview(peer_path) + "...")
+
+    @staticmethod
+    def _read_preview(path: Path, limit: int = 512) -> str:
+        """Read only the first `limit` bytes of a report for previewing"""
+        with open(path, 'rb') as f:
+            return f.read(limit).decode('utf-8', 'replace')
 
 
 def main():
@@ -487,7 +635,24 @@ def main():
             
             pdf_path = manager.get_pdf_path()
             manager.run_peer_audit(repo_info["url"], pdf_path, repo_info["peer_name"])
-        
+
+        elif "PARALLEL" in choice:
+            manager.display_header("Parallel Audit Mode")
+            console.print("[bold]Your repository:[/bold]")
+            self_info = manager.get_repo_info()
+            self_pdf = manager.get_pdf_path()
+
+            console.print("[bold]Peer repository:[/bold]")
+            peer_info = manager.get_repo_info()
+            if not peer_info["is_peer"]:
+                console.print("[red]Please confirm the second repository is a peer's.[/red]")
+                continue
+            peer_pdf = manager.get_pdf_path()
+
+            manager.run_parallel_audits(
+                self_info["url"], self_pdf,
+                peer_info["url"], peer_pdf, peer_info["peer_name"])
+
         elif "View/Manage" in choice:
             manager.display_header("Received Reports")
             
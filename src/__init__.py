@@ -3,8 +3,16 @@ Automaton Auditor - A multi-agent system for autonomous code governance.
 Uses LangGraph orchestration with Gemini models for forensic analysis.
 """
 
-from .graph import AutomatonAuditor
 from .state import AgentState, Evidence, JudicialOpinion
 
 __version__ = "2.0.0"
-__all__ = ["AutomatonAuditor", "AgentState", "Evidence", "JudicialOpinion"]
\ No newline at end of file
+__all__ = ["AutomatonAuditor", "AgentState", "Evidence", "JudicialOpinion"]
+
+
+def __getattr__(name):
+    # PEP 562 lazy import: pulling in .graph drags the whole LangGraph/LLM
+    # stack, so defer it until AutomatonAuditor is actually accessed
+    if name == "AutomatonAuditor":
+        from .graph import AutomatonAuditor
+        return AutomatonAuditor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,16 @@
 """
 Centralized prompt management for all agents.
 Ensures consistency and easy updates.
+
+Prompt bodies are frozen module-level constants built once at import:
+the detective prompts take no arguments, and the judge prompts are
+str.format templates, so the hot call path never re-concatenates the
+multi-hundred-token strings.
 """
 
-class DetectivePrompts:
-    """Prompts for forensic detectives"""
-    
-    @staticmethod
-    def get_repo_prompt() -> str:
-        return """You are RepoInvestigator, a forensic code detective.
+from typing import Final
+
+REPO_PROMPT: Final[str] = """You are RepoInvestigator, a forensic code detective.
 Your ONLY job is to collect FACTS about the repository.
 Do NOT give opinions or judgments.
 Do NOT interpret the findings.
@@ -31,9 +33,7 @@ Forensic Protocol C (Git Narrative):
 
 Return ONLY structured JSON with your findings."""
 
-    @staticmethod
-    def get_doc_prompt() -> str:
-        return """You are DocAnalyst, a document forensic detective.
+DOC_PROMPT: Final[str] = """You are DocAnalyst, a document forensic detective.
 Your ONLY job is to collect FACTS from the PDF report.
 Do NOT give opinions or judgments.
 Do NOT interpret the findings.
@@ -50,9 +50,7 @@ Forensic Protocol B (Concept Verification):
 
 Return ONLY structured JSON with your findings."""
 
-    @staticmethod
-    def get_vision_prompt() -> str:
-        return """You are VisionInspector, a diagram forensic detective.
+VISION_PROMPT: Final[str] = """You are VisionInspector, a diagram forensic detective.
 Your ONLY job is to analyze architectural diagrams.
 Do NOT give opinions or judgments.
 Do NOT interpret beyond what you see.
@@ -65,13 +63,7 @@ Forensic Protocol A (Flow Analysis):
 
 Return ONLY structured JSON with your findings."""
 
-
-class JudgePrompts:
-    """Prompts for dialectical judges"""
-    
-    @staticmethod
-    def get_prosecutor_prompt(dimension: str, logic: str, evidence: str) -> str:
-        return f"""You are the PROSECUTOR in a digital courtroom.
+PROSECUTOR_TEMPLATE: Final[str] = """You are the PROSECUTOR in a digital courtroom.
 Your philosophy: "Trust No One. Assume Vibe Coding."
 Your job: Find violations, security flaws, and laziness in the implementation.
 
@@ -98,10 +90,8 @@ You MUST return a JSON object with:
 - dissent_notes: string explaining why you disagree with Defense
 
 Remember: You are the PROSECUTOR. Find the flaws."""
-    
-    @staticmethod
-    def get_defense_prompt(dimension: str, logic: str, evidence: str) -> str:
-        return f"""You are the DEFENSE ATTORNEY in a digital courtroom.
+
+DEFENSE_TEMPLATE: Final[str] = """You are the DEFENSE ATTORNEY in a digital courtroom.
 Your philosophy: "Reward Effort and Intent. Look for the Spirit of the Law."
 Your job: Highlight creative workarounds, deep thought, and effort.
 
@@ -128,10 +118,8 @@ You MUST return a JSON object with:
 - dissent_notes: string explaining why you disagree with Prosecutor
 
 Remember: You are the DEFENSE. Find the good in their work."""
-    
-    @staticmethod
-    def get_techlead_prompt(dimension: str, logic: str, evidence: str) -> str:
-        return f"""You are the TECH LEAD in a digital courtroom.
+
+TECHLEAD_TEMPLATE: Final[str] = """You are the TECH LEAD in a digital courtroom.
 Your philosophy: "Does it actually work? Is it maintainable?"
 Your job: Evaluate architectural soundness, code cleanliness, and practical viability.
 
@@ -157,4 +145,36 @@ You MUST return a JSON object with:
 - cited_evidence: list of strings (locations supporting your assessment)
 - dissent_notes: string explaining your tie-breaking perspective
 
-Remember: You are the TECH LEAD. Be pragmatic and realistic."""
\ No newline at end of file
+Remember: You are the TECH LEAD. Be pragmatic and realistic."""
+
+
+class DetectivePrompts:
+    """Prompts for forensic detectives"""
+
+    @staticmethod
+    def get_repo_prompt() -> str:
+        return REPO_PROMPT
+
+    @staticmethod
+    def get_doc_prompt() -> str:
+        return DOC_PROMPT
+
+    @staticmethod
+    def get_vision_prompt() -> str:
+        return VISION_PROMPT
+
+
+class JudgePrompts:
+    """Prompts for dialectical judges"""
+
+    @staticmethod
+    def get_prosecutor_prompt(dimension: str, logic: str, evidence: str) -> str:
+        return PROSECUTOR_TEMPLATE.format(dimension=dimension, logic=logic, evidence=evidence)
+
+    @staticmethod
+    def get_defense_prompt(dimension: str, logic: str, evidence: str) -> str:
+        return DEFENSE_TEMPLATE.format(dimension=dimension, logic=logic, evidence=evidence)
+
+    @staticmethod
+    def get_techlead_prompt(dimension: str, logic: str, evidence: str) -> str:
+        return TECHLEAD_TEMPLATE.format(dimension=dimension, logic=logic, evidence=evidence)
@@ -5,182 +5,316 @@ Uses operator.add and operator.ior reducers for proper state management.
 """
 
 import os
+import time
 import json
 import uuid
+import queue
+import logging
+import functools
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Literal
 from pathlib import Path
 import operator
 
+import httpx
+
 from langgraph.graph import START,StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.constants import START
 
-from src.state import AgentState, RubricDimension, SynthesisRule, Evidence, JudicialOpinion
+try:
+    from langgraph.checkpoint.sqlite import SqliteSaver
+except ImportError:  # optional extra - fall back to in-memory checkpoints
+    SqliteSaver = None
+
+from src.state import (
+    AgentState, RubricDimensionList, SynthesisRule,
+    Evidence, JudicialOpinion
+)
 from src.nodes.detectives import RepoInvestigator, DocAnalyst, VisionInspector
-from src.nodes.judges import Prosecutor, Defense, TechLead
+from src.nodes.judges import Prosecutor, Defense, TechLead, JudicialBench
 from src.nodes.justice import ChiefJustice
 
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _enable_error_log() -> None:
+    """
+    Route error records through a queue drained by a background listener,
+    so the failing thread hands off the record and returns instead of
+    blocking on terminal or file I/O inside the exception handler.
+    """
+    os.makedirs("audits", exist_ok=True)
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, logging.FileHandler("audits/errors.log"))
+    listener.start()
+    logger.addHandler(QueueHandler(log_queue))
+
+
+def _json_default(obj):
+    """Serialize Pydantic models lazily and stringify anything else"""
+    if hasattr(obj, 'model_dump'):
+        return obj.model_dump()
+    return str(obj)
+
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        """C-level JSON encoding - large evidence dumps are the hot case"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=_json_default)
+
+    _loads = orjson.loads
+
+except ImportError:
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=_json_default).encode('utf-8')
+
+    _loads = json.loads
+
+
+@functools.lru_cache(maxsize=8)
+def _load_rubric_cached(path: str, mtime: float) -> Dict:
+    """
+    Parse rubric JSON once per (path, mtime).
+    Repeated AutomatonAuditor constructions in the same session skip the
+    file read and JSON decode; mtime keying invalidates on rubric edits.
+    """
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_report_dirs() -> bool:
+    """Create the audit output directories once per process, not per save"""
+    Path("audits/report_onself_generated").mkdir(parents=True, exist_ok=True)
+    Path("audits/langsmith_logs").mkdir(parents=True, exist_ok=True)
+    return True
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_rubric_models(path: str, mtime: float):
+    """
+    Validate the rubric's Pydantic models once per (path, mtime).
+    The dimension array goes through RubricDimensionList so pydantic-core
+    validates the whole list in one pass; the frozen models are safe to
+    share across audits.
+    """
+    rubric = _load_rubric_cached(path, mtime)
+    dimensions = tuple(RubricDimensionList.model_validate(rubric['dimensions']).root)
+    rules = SynthesisRule(**rubric['synthesis_rules'])
+    return dimensions, rules
+
+
 class AutomatonAuditor:
     """Main orchestrator for the autonomous auditor swarm"""
-    
+
     def __init__(self, rubric_path: str = "ruberics\\week2_ruberic.json"):
         self.rubric_path = rubric_path
         self.rubric = self._load_rubric()
-        
+
+        # Frozen rubric models bound once per instance; every run() reuses
+        # them instead of re-validating (or even re-statting) the rubric
+        self._dimensions, self._rules = _parse_rubric_models(
+            self.rubric_path, os.path.getmtime(self.rubric_path)
+        )
+
+        # One keep-alive connection pool for every Groq caller - the judge
+        # personas and the vision detective; without it each client pays its
+        # own TCP/TLS handshake and the concurrent dispatches open redundant
+        # connections. RepoInvestigator (git subprocess) and DocAnalyst
+        # (local PDF analysis) make no HTTP calls
+        self._http = httpx.Client(
+            timeout=120,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        )
+
         # Initialize agents
         self.repo_investigator = RepoInvestigator()
         self.doc_analyst = DocAnalyst()
-        self.vision_inspector = VisionInspector()
-        
-        self.prosecutor = Prosecutor()
-        self.defense = Defense()
-        self.tech_lead = TechLead()
-        
+        self.vision_inspector = VisionInspector(http_client=self._http)
+        self.prosecutor = Prosecutor(http_client=self._http)
+        self.defense = Defense(http_client=self._http)
+        self.tech_lead = TechLead(http_client=self._http)
+        self.judicial_bench = JudicialBench(self.prosecutor, self.defense, self.tech_lead)
+
         self.chief_justice = ChiefJustice()
-        
-        # Build graph
+
+        # Compile per instance: the graph bakes in this instance's node
+        # objects (DocAnalyst carries per-run parse state), its HTTP pool
+        # and its checkpointer, so sharing a compiled graph across auditors
+        # would cross-contaminate concurrent audits. The expensive parts of
+        # construction - rubric parse/validation and the PDF/AST caches -
+        # are already shared at module level
         self.graph = self._build_graph()
     
+    def close(self) -> None:
+        """Release the shared HTTP connection pool"""
+        self._http.close()
+
     def _load_rubric(self) -> Dict:
-        """Load machine-readable rubric"""
-        with open(self.rubric_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        """Load machine-readable rubric (cached across constructions)"""
+        return _load_rubric_cached(self.rubric_path, os.path.getmtime(self.rubric_path))
     
     def _build_graph(self) -> StateGraph:
         """Construct the hierarchical state graph with proper parallel execution"""
         
         # Initialize graph with our state
         builder = StateGraph(AgentState)
-        
-        # Add nodes for each agent
-        builder.add_node("repo_investigator", self.repo_investigator)
-        builder.add_node("doc_analyst", self.doc_analyst)
-        builder.add_node("vision_inspector", self.vision_inspector)
-        builder.add_node("evidence_aggregator", self._aggregate_evidence)
-        builder.add_node("prosecutor", self.prosecutor)
-        builder.add_node("defense", self.defense)
-        builder.add_node("tech_lead", self.tech_lead)
-        builder.add_node("chief_justice", self.chief_justice)
-        
-        # Set entry point
-        builder.add_edge(START, "repo_investigator")
-        
-        # PARALLEL BRANCHES FOR DETECTIVES - Fan-out
-        # After repo_investigator, run both doc_analyst and vision_inspector in parallel
-        builder.add_edge("repo_investigator", "doc_analyst")
-        builder.add_edge("repo_investigator", "vision_inspector")
-        
-        # FAN-IN SYNCHRONIZATION - Both detectives feed into aggregator
-        builder.add_edge("doc_analyst", "evidence_aggregator")
-        builder.add_edge("vision_inspector", "evidence_aggregator")
-        
-        # PARALLEL BRANCHES FOR JUDGES - Fan-out
-        # After aggregation, run all judges in parallel
-        builder.add_edge("evidence_aggregator", "prosecutor")
-        builder.add_edge("evidence_aggregator", "defense")
-        builder.add_edge("evidence_aggregator", "tech_lead")
-        
-        # FAN-IN SYNCHRONIZATION - All judges feed into chief justice
-        builder.add_edge("prosecutor", "chief_justice")
-        builder.add_edge("defense", "chief_justice")
-        builder.add_edge("tech_lead", "chief_justice")
-        
-        # End after chief justice
-        builder.add_edge("chief_justice", END)
-        
-        # CONDITIONAL EDGES FOR ERROR HANDLING
-        builder.add_conditional_edges(
-            "repo_investigator",
-            self._check_clone_success,
-            {
-                "continue": "doc_analyst",  # Success path
-                "error_doc": END,  # Error path for doc_analyst
-                "error_vision": END  # Error path for vision_inspector
-            }
+
+        # Static topology as tables, registered in one pass each.
+        # All three detectives fan out straight from START - the clone, the
+        # PDF parse, and the vision calls overlap, so the detective layer
+        # costs max(branch) instead of clone-then-the-rest. The PDF claim
+        # verification that used to chain doc_analyst behind the repo pass
+        # now happens at the aggregator fan-in, which also aborts the run
+        # on clone failure. The bench batches all (judge, dimension) calls
+        # into one concurrent dispatch before synthesis.
+        nodes = (
+            ("repo_investigator", self.repo_investigator),
+            ("doc_analyst", self.doc_analyst),
+            ("vision_inspector", self.vision_inspector),
+            ("evidence_aggregator", self._aggregate_evidence),
+            ("judicial_bench", self.judicial_bench),
+            ("chief_justice", self.chief_justice),
         )
-        
-        # Additional error handling for evidence collection
+        edges = (
+            (START, "repo_investigator"),
+            (START, "doc_analyst"),
+            (START, "vision_inspector"),
+            ("repo_investigator", "evidence_aggregator"),
+            ("doc_analyst", "evidence_aggregator"),
+            ("vision_inspector", "evidence_aggregator"),
+            ("judicial_bench", "chief_justice"),
+            ("chief_justice", END),
+        )
+        for name, node in nodes:
+            builder.add_node(name, node)
+        for src, dst in edges:
+            builder.add_edge(src, dst)
+
+        # The aggregator routes to the bench ONLY through this conditional -
+        # a static aggregator->bench edge would activate the bench no matter
+        # what the router returns, so the clone-failure abort would never
+        # actually stop the judges
         builder.add_conditional_edges(
             "evidence_aggregator",
             self._check_evidence_collected,
             {
-                "continue": "prosecutor",  # Has evidence
+                "continue": "judicial_bench",  # Has evidence
                 "error": END  # No evidence collected
             }
         )
         
-        # Compile with memory for state persistence
-        memory = MemorySaver()
-        return builder.compile(checkpointer=memory)
+        # Compile with a durable checkpointer: MemorySaver accumulates every
+        # intermediate state per thread_id in process memory for the life of
+        # the process, while SQLite keeps checkpoints on disk with a bounded
+        # footprint and lets a run be resumed from another process
+        if SqliteSaver is not None:
+            import sqlite3
+            os.makedirs("audits", exist_ok=True)
+            conn = sqlite3.connect("audits/checkpoints.db", check_same_thread=False)
+            # WAL lets checkpoint writes append to the log instead of
+            # rewriting pages, and NORMAL fsync is plenty for resumable
+            # audit state - a lost last checkpoint just means re-running
+            # one node
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            checkpointer = SqliteSaver(conn)
+        else:
+            checkpointer = MemorySaver()
+        return builder.compile(checkpointer=checkpointer)
     
     def _aggregate_evidence(self, state: AgentState) -> Dict[str, Any]:
         """
-        Synchronization node - aggregates evidence from all detectives.
+        Synchronization node - aggregates evidence from all detectives and
+        verifies the PDF's file-path claims against repo evidence, now that
+        both parallel branches have landed.
         Uses operator.ior reducer to merge evidence from parallel branches.
         """
-        # Count evidence types for metadata
-        evidence_counts = {
-            key: len(value) for key, value in state.get('evidences', {}).items()
-        }
-        
-        # Validate that we have at least some evidence
-        total_evidence = sum(evidence_counts.values())
-        
+        evidences = {}
+
+        # Cross-reference PDF claims against the repository evidence. The
+        # doc branch only extracts claims, so it never waits on the clone;
+        # the join happens here where both sides are guaranteed present.
+        # Every location is joined once up front, so each claim costs one
+        # C-level substring search instead of a nested loop over evidence
+        claims = []
+        for evidence in state.get('evidences', {}).get('pdf_claims', []):
+            if evidence.content:
+                claims.extend(_loads(evidence.content))
+
+        if claims:
+            location_blob = "\n".join(
+                str(evidence.location)
+                for evidence_list in state['evidences'].values()
+                for evidence in evidence_list
+                if evidence.location
+            )
+            verified_claims = [
+                {
+                    'claim': claim,
+                    'verified': claim in location_blob,
+                    'source': 'PDF'
+                }
+                for claim in claims
+            ]
+            evidences['cross_reference'] = [Evidence(
+                goal="Cross-reference PDF claims with repository evidence",
+                found=any(vc['verified'] for vc in verified_claims),
+                content=_dumps(verified_claims).decode(),
+                location="PDF Report cross-reference",
+                rationale=f"Verified {sum(1 for vc in verified_claims if vc['verified'])} out of {len(verified_claims)} claims",
+                confidence=0.8
+            )]
+
+        # Count evidence types for metadata - one pass builds the per-type
+        # counts and the running total together
+        evidence_counts = {}
+        total_evidence = 0
+        for key, value in state.get('evidences', {}).items():
+            count = len(value)
+            evidence_counts[key] = count
+            total_evidence += count
+
         # Update execution metadata
         metadata = state.get('execution_metadata', {})
         metadata['evidence_aggregated'] = evidence_counts
         metadata['total_evidence'] = total_evidence
-        metadata['aggregation_time'] = str(uuid.uuid4())
-        
-        return {"execution_metadata": metadata}
-    
-    def _check_clone_success(self, state: AgentState) -> str:
-        """
-        Conditional edge to handle git clone errors.
-        Returns different paths based on error type.
-        """
-        if 'git_clone' in state.get('evidences', {}):
-            for evidence in state['evidences']['git_clone']:
-                if not evidence.found:
-                    # Check error type for different handling
-                    error_msg = str(evidence.content).lower() if evidence.content else ""
-                    if "permission" in error_msg or "authentication" in error_msg:
-                        return "error_doc"  # Auth error - can't proceed
-                    elif "not found" in error_msg or "does not exist" in error_msg:
-                        return "error_vision"  # Repo doesn't exist
-                    else:
-                        return "error_doc"  # Generic error
-        
-        # Also check for other critical errors
-        if 'error' in state.get('evidences', {}):
-            return "error_doc"
-        
-        return "continue"
+        metadata['aggregation_time_ns'] = time.perf_counter_ns()
+
+        return {"evidences": evidences, "execution_metadata": metadata}
     
     def _check_evidence_collected(self, state: AgentState) -> str:
-        """Conditional edge to handle cases with no evidence"""
+        """Conditional edge to handle clone failure or no evidence"""
+
+        # Clone failure - the other branches may have produced evidence,
+        # but there is no repository to judge
+        for evidence in state.get('evidences', {}).get('git_clone', []):
+            if not evidence.found:
+                return "error"
+
         total_evidence = 0
         for evidence_list in state.get('evidences', {}).values():
             total_evidence += len(evidence_list)
-        
+
         if total_evidence == 0:
             return "error"
-        
+
         return "continue"
     
     def prepare_initial_state(self, repo_url: str, pdf_path: str) -> AgentState:
         """Prepare initial state with rubric and rules"""
-        
-        # Parse rubric dimensions
-        dimensions = [
-            RubricDimension(**dim) 
-            for dim in self.rubric['dimensions']
-        ]
-        
-        # Parse synthesis rules
-        rules = SynthesisRule(**self.rubric['synthesis_rules'])
-        
+
+        # Frozen models validated at construction, shared across runs
+        dimensions = list(self._dimensions)
+        rules = self._rules
+
         return {
             "repo_url": repo_url,
             "pdf_path": pdf_path,
@@ -192,7 +326,7 @@ class AutomatonAuditor:
             "final_report": "",
             "error_log": [],
             "execution_metadata": {
-                "start_time": str(uuid.uuid4()),
+                "start_time_ns": time.perf_counter_ns(),
                 "evidence_counts": {},
                 "opinion_counts": {}
             }
@@ -225,20 +359,28 @@ class AutomatonAuditor:
             }
         }
         
+        start = time.perf_counter_ns()
+
         try:
             # Run graph with config
             final_state = self.graph.invoke(initial_state, config=config)
-            
+
+            # Monotonic clock, written once at the end rather than
+            # per-step wall-clock reads
+            final_state['execution_metadata']['execution_time'] = (
+                (time.perf_counter_ns() - start) / 1e9
+            )
+
             # Save reports
             self._save_reports(final_state)
-            
+
             return final_state
             
         except Exception as e:
-            print(f"Error during graph execution: {str(e)}")
             import traceback
-            traceback.print_exc()
-            
+            _enable_error_log()
+            logger.exception("Graph execution failed")
+
             # Save error state for debugging
             error_state = {
                 **initial_state,
@@ -248,35 +390,95 @@ class AutomatonAuditor:
             self._save_reports(error_state)
             raise
     
+    def run_batch(self, repo_url: str, pdf_path: str) -> Dict[str, Any]:
+        """
+        Offline batch path: drive the nodes directly, without the graph
+        runtime or checkpointer. All three detectives run once in
+        parallel, then every (dimension, persona) prompt goes through
+        the bench's single concurrent dispatch before synthesis. Useful for bulk re-grading
+        where per-step checkpoints are dead weight; keep `run()` for
+        debugging individual graph steps.
+        """
+        start = time.perf_counter_ns()
+        state = self.prepare_initial_state(repo_url, pdf_path)
+
+        # All three detectives are independent (claim verification happens
+        # at aggregation), so the clone, the PDF parse, and the vision calls
+        # overlap and the layer costs max(branch) instead of their sum.
+        # Nodes return evidence deltas; apply the reducer merge by hand
+        # since the graph runtime is not driving this path
+        detectives = (self.repo_investigator, self.doc_analyst, self.vision_inspector)
+        with ThreadPoolExecutor(max_workers=len(detectives)) as pool:
+            for result in pool.map(lambda node: node(state), detectives):
+                state['evidences'] = state['evidences'] | result['evidences']
+
+        aggregated = self._aggregate_evidence(state)
+        state['evidences'] = state['evidences'] | aggregated['evidences']
+        state['execution_metadata'] = aggregated['execution_metadata']
+
+        if self._check_evidence_collected(state) == "error":
+            state['final_report'] = "# Audit Failed\n\nRepository could not be analyzed or no evidence collected."
+            self._save_reports(state)
+            return state
+
+        # Pipeline synthesis with judge completion: each criterion's verdict
+        # is resolved as soon as its bench finishes, while judges for the
+        # remaining criteria are still decoding
+        resolved_scores = {}
+        dissents = []
+        for dimension, dimension_opinions in self.judicial_bench.iter_dimension_opinions(state):
+            state['opinions'] = state['opinions'] + dimension_opinions
+
+            final_score, dissent = self.chief_justice._resolve_criterion(
+                dimension.id,
+                dimension.name,
+                dimension_opinions,
+                state['evidences'],
+                state['synthesis_rules']
+            )
+            resolved_scores[dimension.id] = {
+                'name': dimension.name,
+                'score': final_score,
+                'dissent': dissent
+            }
+            if dissent:
+                dissents.append(dissent)
+
+        state['final_report'] = self.chief_justice._generate_report(
+            resolved_scores, dissents, repo_url, pdf_path
+        )
+        state['execution_metadata'].update({
+            'total_opinions': len(state['opinions']),
+            'criteria_resolved': len(resolved_scores),
+            'execution_time': (time.perf_counter_ns() - start) / 1e9
+        })
+
+        self._save_reports(state)
+        return state
+
     def _save_reports(self, state: AgentState):
-        """Save audit reports to disk"""
-        
-        # Create audit directories if they don't exist
-        os.makedirs("audits/report_onself_generated", exist_ok=True)
-        os.makedirs("audits/langsmith_logs", exist_ok=True)
-        
-        # Save main report
-        report_path = "audits/report_onself_generated/audit_report.md"
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(state.get('final_report', '# No report generated'))
-        
-        # Save execution metadata
-        metadata_path = "audits/langsmith_logs/execution_metadata.json"
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            # Convert any non-serializable objects
-            metadata = state.get('execution_metadata', {})
-            json.dump(metadata, f, indent=2, default=str)
-        
-        # Save evidence summary
-        evidence_path = "audits/langsmith_logs/evidence_summary.json"
-        evidence_summary = {}
-        for key, ev_set in state.get('evidences', {}).items():
-            evidence_summary[key] = []
-            for evidence in ev_set:
-                if hasattr(evidence, 'model_dump'):
-                    evidence_summary[key].append(evidence.model_dump())
-                else:
-                    evidence_summary[key].append(str(evidence))
-        
-        with open(evidence_path, 'w', encoding='utf-8') as f:
-            json.dump(evidence_summary, f, indent=2, default=str)
\ No newline at end of file
+        """Save audit reports to disk (the three writes fan out to threads)"""
+
+        _ensure_report_dirs()
+
+        # Serialize first (CPU), then let the independent writes overlap.
+        # The Evidence models go straight into the encoder: _json_default
+        # calls model_dump lazily, skipping an intermediate dict tree
+        report_bytes = state.get('final_report', '# No report generated').encode('utf-8')
+        metadata_bytes = _dumps(state.get('execution_metadata', {}))
+        evidence_bytes = _dumps({
+            key: list(ev_set)
+            for key, ev_set in state.get('evidences', {}).items()
+        })
+
+        targets = [
+            ("audits/report_onself_generated/audit_report.md", report_bytes),
+            ("audits/langsmith_logs/execution_metadata.json", metadata_bytes),
+            ("audits/langsmith_logs/evidence_summary.json", evidence_bytes),
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+            list(pool.map(
+                lambda target: Path(target[0]).write_bytes(target[1]),
+                targets
+            ))
\ No newline at end of file
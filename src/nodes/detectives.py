@@ -4,8 +4,11 @@ No opinions - only facts based on strict forensic protocols.
 """
 
 import os
+import re
 import json
-from typing import Dict, List, Any
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Tuple
 from langgraph.graph import StateGraph
 import asyncio
 
@@ -15,6 +18,29 @@ from src.tools.ast_tools import ASTAnalyzer
 from src.tools.doc_tools import PDFForensics
 from src.tools.vision_tools import VisionForensics
 from src.config.prompts import DetectivePrompts
+from src.utils import evidence_cache
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    def _json(obj) -> str:
+        """C-level JSON encoding for Evidence content blobs"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+
+    def _json(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+# Clone-failure classification, compiled once at import
+_AUTH_ERROR_RE = re.compile(r'permission|authentication', re.IGNORECASE)
+_MISSING_REPO_RE = re.compile(r'not found|does not exist', re.IGNORECASE)
+
+# File-path claims in PDF text: either a slash-joined path with an
+# extension or a bare Python filename
+_PATH_RE = re.compile(r'(?:[\w.-]+/)+[\w.-]+\.\w+|[\w-]+\.py\b')
 
 
 class RepoInvestigator:
@@ -25,154 +51,60 @@ class RepoInvestigator:
         self.prompts = DetectivePrompts()
     
     def __call__(self, state: AgentState) -> Dict[str, Any]:
-        """Execute forensic analysis on repository"""
+        """
+        Execute forensic analysis on repository.
+        Runs as one of three parallel detective branches; clone failures
+        surface as git_clone evidence and the fan-in evaluator aborts on it.
+        """
         evidences = {}
-        
+
+        # Re-audits of the same commit are deterministic - serve from cache
+        cache_id = evidence_cache.cache_key(
+            'repo_investigator', state['repo_url'],
+            evidence_cache.remote_head(state['repo_url'])
+        )
+        cached = evidence_cache.load_evidence(cache_id)
+        if cached is not None:
+            logger.info("RepoInvestigator cache hit - skipping clone and analysis")
+            return {"evidences": cached}
+
         try:
             with GitForensics() as git:
                 # Clone repo in sandbox
                 success, message = git.clone_repository(state['repo_url'])
-                
+
                 if not success:
+                    reason = "clone failed"
+                    if _AUTH_ERROR_RE.search(message or ""):
+                        reason = "authentication/permission failure"
+                    elif _MISSING_REPO_RE.search(message or ""):
+                        reason = "repository not found"
+
                     evidences['git_clone'] = [Evidence(
                         goal="Clone repository for analysis",
                         found=False,
                         content=message,
                         location="git clone operation",
-                        rationale="Repository clone failed - cannot proceed with code analysis",
+                        rationale=f"Repository clone failed ({reason}) - cannot proceed with code analysis",
                         confidence=1.0
                     )]
-                    return {"evidences": state['evidences'] | evidences}
-                
-                # Collect forensic evidence
-                
-                # 1. Git History Analysis
-                commits = git.get_commit_history()
-                evidences['git_history'] = [Evidence(
-                    goal="Analyze commit history for development patterns",
-                    found=len(commits) > 0,
-                    content=json.dumps(commits, indent=2),
-                    location="git log",
-                    rationale=f"Found {len(commits)} commits showing development progression",
-                    confidence=0.95 if len(commits) > 3 else 0.7
-                )]
-                
-                # 2. State Management Check
-                state_files = git.find_files('state.py') + git.find_files('graph.py')
-                state_evidence = []
-                
-                for file in state_files[:3]:  # Check first few
-                    content = git.read_file(file)
-                    if content:
-                        tree = self.ast_analyzer.parse_file(os.path.join(git.repo_path, file))
-                        if tree:
-                            models = self.ast_analyzer.find_pydantic_models(tree)
-                            state_evidence.append(Evidence(
-                                goal="Verify Pydantic state models",
-                                found=len(models) > 0,
-                                content=f"Found models: {[m['name'] for m in models]}",
-                                location=file,
-                                rationale=f"{'Found' if models else 'No'} Pydantic models in {file}",
-                                confidence=0.9 if models else 0.8
-                            ))
-                
-                if not state_evidence:
-                    state_evidence.append(Evidence(
-                        goal="Verify Pydantic state models",
-                        found=False,
-                        content=None,
-                        location="src/state.py or src/graph.py",
-                        rationale="No state definition files found with Pydantic models",
-                        confidence=1.0
-                    ))
-                
-                evidences['state_management'] = state_evidence
-                
-                # 3. Graph Orchestration Analysis
-                graph_evidence = []
-                for file in git.find_files('graph.py'):
-                    content = git.read_file(file)
-                    if content:
-                        tree = self.ast_analyzer.parse_file(os.path.join(git.repo_path, file))
-                        if tree:
-                            graph_info = self.ast_analyzer.find_stategraph_usage(tree)
-                            graph_evidence.append(Evidence(
-                                goal="Analyze graph orchestration for parallelism",
-                                found=graph_info['has_stategraph'],
-                                content=json.dumps(graph_info, indent=2),
-                                location=file,
-                                rationale=f"Graph {'has' if graph_info['has_stategraph'] else 'lacks'} StateGraph. Parallel patterns: {graph_info['parallel_patterns']}",
-                                confidence=0.85
-                            ))
-                
-                evidences['graph_orchestration'] = graph_evidence
-                
-                # 4. Tool Safety Check
-                tool_files = git.find_files('tools/')
-                safety_evidence = []
-                
-                for file in tool_files:
-                    if file.endswith('.py'):
-                        content = git.read_file(file)
-                        if content:
-                            tree = self.ast_analyzer.parse_file(os.path.join(git.repo_path, file))
-                            if tree:
-                                unsafe_calls = self.ast_analyzer.find_os_system_calls(tree)
-                                if unsafe_calls:
-                                    safety_evidence.append(Evidence(
-                                        goal="Verify sandboxed tool execution",
-                                        found=False,
-                                        content=json.dumps(unsafe_calls),
-                                        location=file,
-                                        rationale=f"Found {len(unsafe_calls)} unsafe os.system calls without sandboxing",
-                                        confidence=1.0
-                                    ))
-                
-                if not safety_evidence:
-                    safety_evidence.append(Evidence(
-                        goal="Verify sandboxed tool execution",
-                        found=True,
-                        content="No unsafe system calls detected",
-                        location="src/tools/",
-                        rationale="All tools appear to use safe practices",
-                        confidence=0.9
-                    ))
-                
-                evidences['tool_safety'] = safety_evidence
-                
-                # 5. Structured Output Check
-                judge_files = git.find_files('judges.py') + git.find_files('nodes/')
-                structured_evidence = []
-                
-                for file in judge_files:
-                    if file.endswith('.py'):
-                        content = git.read_file(file)
-                        if content:
-                            tree = self.ast_analyzer.parse_file(os.path.join(git.repo_path, file))
-                            if tree:
-                                structured_calls = self.ast_analyzer.find_structured_output_usage(tree)
-                                if structured_calls:
-                                    structured_evidence.append(Evidence(
-                                        goal="Verify structured JSON output enforcement",
-                                        found=True,
-                                        content=json.dumps(structured_calls),
-                                        location=file,
-                                        rationale=f"Found structured output enforcement: {[c['method'] for c in structured_calls]}",
-                                        confidence=0.9
-                                    ))
-                
-                if not structured_evidence:
-                    structured_evidence.append(Evidence(
-                        goal="Verify structured JSON output enforcement",
-                        found=False,
-                        content=None,
-                        location="src/nodes/judges.py",
-                        rationale="No .with_structured_output() or .bind_tools() calls detected",
-                        confidence=0.85
-                    ))
-                
-                evidences['structured_output'] = structured_evidence
+                    return {"evidences": evidences}
                 
+                # Collect forensic evidence. The five protocols only read
+                # the cloned worktree (git log, file reads, AST walks) and
+                # are independent, so they fan out on threads and the node
+                # pays max(protocol) instead of their sum
+                protocols = (
+                    self._analyze_git_history,
+                    self._analyze_state_management,
+                    self._analyze_graph_orchestration,
+                    self._analyze_tool_safety,
+                    self._analyze_structured_output,
+                )
+                with ThreadPoolExecutor(max_workers=len(protocols)) as pool:
+                    for key, found in pool.map(lambda protocol: protocol(git), protocols):
+                        evidences[key] = found
+
         except Exception as e:
             evidences['error'] = [Evidence(
                 goal="Handle repository analysis errors",
@@ -182,9 +114,171 @@ class RepoInvestigator:
                 rationale=f"Analysis failed with error: {str(e)}",
                 confidence=1.0
             )]
-        
-        # Merge with existing evidences using operator.ior
-        return {"evidences": state['evidences'] | evidences}
+
+        if 'error' not in evidences:
+            evidence_cache.save_evidence(cache_id, evidences)
+
+        # Return only this node's delta - the operator.ior reducer merges it
+        return {"evidences": evidences}
+
+    def _analyze_files(
+        self,
+        git: GitForensics,
+        files: List[str],
+        markers: Tuple[bytes, ...] = ()
+    ) -> List[Tuple[str, Any]]:
+        """
+        Fused AST analysis for a batch of files, fanned out on threads.
+        The reads release the GIL, so on repos with many candidate files
+        the I/O overlaps instead of serializing per file. When markers are
+        given, files whose raw bytes contain none of them skip the parse
+        entirely - a C-level substring scan is orders of magnitude cheaper
+        than ast.parse, and most tool files contain no unsafe calls.
+        Returns (relative path, analysis-or-None) pairs in input order.
+        """
+        if not files:
+            return []
+
+        def analyze(file: str):
+            path = os.path.join(git.repo_path, file)
+            if markers:
+                try:
+                    with open(path, 'rb') as f:
+                        raw = f.read()
+                except OSError:
+                    return None
+                if not any(marker in raw for marker in markers):
+                    return None
+            return self.ast_analyzer.analyze_file(path)
+
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+            return list(zip(files, pool.map(analyze, files)))
+
+    def _analyze_git_history(self, git: GitForensics) -> Tuple[str, List[Evidence]]:
+        """Forensic Protocol: commit history and development progression"""
+        commits = git.get_commit_history()
+        return 'git_history', [Evidence(
+            goal="Analyze commit history for development patterns",
+            found=len(commits) > 0,
+            content=_json(commits),
+            location="git log",
+            rationale=f"Found {len(commits)} commits showing development progression",
+            confidence=0.95 if len(commits) > 3 else 0.7
+        )]
+
+    def _analyze_state_management(self, git: GitForensics) -> Tuple[str, List[Evidence]]:
+        """Forensic Protocol: Pydantic state model definitions"""
+        state_files = git.find_files('state.py') + git.find_files('graph.py')
+        state_evidence = []
+
+        for file, analysis in self._analyze_files(git, state_files[:3]):  # Check first few
+            if analysis:
+                models = analysis['pydantic_models']
+                state_evidence.append(Evidence(
+                    goal="Verify Pydantic state models",
+                    found=len(models) > 0,
+                    content=f"Found models: {[m['name'] for m in models]}",
+                    location=file,
+                    rationale=f"{'Found' if models else 'No'} Pydantic models in {file}",
+                    confidence=0.9 if models else 0.8
+                ))
+
+        if not state_evidence:
+            state_evidence.append(Evidence(
+                goal="Verify Pydantic state models",
+                found=False,
+                content=None,
+                location="src/state.py or src/graph.py",
+                rationale="No state definition files found with Pydantic models",
+                confidence=1.0
+            ))
+
+        return 'state_management', state_evidence
+
+    def _analyze_graph_orchestration(self, git: GitForensics) -> Tuple[str, List[Evidence]]:
+        """Forensic Protocol: StateGraph wiring and parallel patterns"""
+        graph_evidence = []
+        for file, analysis in self._analyze_files(git, git.find_files('graph.py')):
+            if analysis:
+                graph_info = analysis['stategraph']
+                graph_evidence.append(Evidence(
+                    goal="Analyze graph orchestration for parallelism",
+                    found=graph_info['has_stategraph'],
+                    content=_json(graph_info),
+                    location=file,
+                    rationale=f"Graph {'has' if graph_info['has_stategraph'] else 'lacks'} StateGraph. Parallel patterns: {graph_info['parallel_patterns']}",
+                    confidence=0.85
+                ))
+
+        return 'graph_orchestration', graph_evidence
+
+    def _analyze_tool_safety(self, git: GitForensics) -> Tuple[str, List[Evidence]]:
+        """Forensic Protocol: unsafe system calls in tool modules"""
+        tool_files = git.find_files('tools/')
+        safety_evidence = []
+
+        py_files = [f for f in tool_files if f.endswith('.py')]
+        for file, analysis in self._analyze_files(git, py_files, markers=(b'os.system',)):
+            if analysis:
+                unsafe_calls = analysis['os_system']
+                if unsafe_calls:
+                    safety_evidence.append(Evidence(
+                        goal="Verify sandboxed tool execution",
+                        found=False,
+                        content=_json(unsafe_calls),
+                        location=file,
+                        rationale=f"Found {len(unsafe_calls)} unsafe os.system calls without sandboxing",
+                        confidence=1.0
+                    ))
+
+        if not safety_evidence:
+            safety_evidence.append(Evidence(
+                goal="Verify sandboxed tool execution",
+                found=True,
+                content="No unsafe system calls detected",
+                location="src/tools/",
+                rationale="All tools appear to use safe practices",
+                confidence=0.9
+            ))
+
+        return 'tool_safety', safety_evidence
+
+    def _analyze_structured_output(self, git: GitForensics) -> Tuple[str, List[Evidence]]:
+        """Forensic Protocol: structured JSON output enforcement in judges"""
+        # The two patterns overlap (nodes/ contains judges.py) - dedupe
+        # while keeping order so each file is parsed and reported once
+        judge_files = list(dict.fromkeys(
+            git.find_files('judges.py') + git.find_files('nodes/')
+        ))
+        structured_evidence = []
+
+        py_files = [f for f in judge_files if f.endswith('.py')]
+        for file, analysis in self._analyze_files(
+            git, py_files, markers=(b'with_structured_output', b'bind_tools')
+        ):
+            if analysis:
+                structured_calls = analysis['structured_output']
+                if structured_calls:
+                    structured_evidence.append(Evidence(
+                        goal="Verify structured JSON output enforcement",
+                        found=True,
+                        content=_json(structured_calls),
+                        location=file,
+                        rationale=f"Found structured output enforcement: {[c['method'] for c in structured_calls]}",
+                        confidence=0.9
+                    ))
+
+        if not structured_evidence:
+            structured_evidence.append(Evidence(
+                goal="Verify structured JSON output enforcement",
+                found=False,
+                content=None,
+                location="src/nodes/judges.py",
+                rationale="No .with_structured_output() or .bind_tools() calls detected",
+                confidence=0.85
+            ))
+
+        return 'structured_output', structured_evidence
 
 
 class DocAnalyst:
@@ -197,7 +291,16 @@ class DocAnalyst:
     def __call__(self, state: AgentState) -> Dict[str, Any]:
         """Execute forensic analysis on PDF report"""
         evidences = {}
-        
+
+        # Claims are verified post-aggregation, so the key is the PDF alone
+        cache_id = evidence_cache.cache_key(
+            'doc_analyst', evidence_cache.file_sha256(state['pdf_path'])
+        )
+        cached = evidence_cache.load_evidence(cache_id)
+        if cached is not None:
+            logger.info("DocAnalyst cache hit - skipping PDF parse and analysis")
+            return {"evidences": cached}
+
         try:
             # Load PDF
             if not os.path.exists(state['pdf_path']):
@@ -209,7 +312,7 @@ class DocAnalyst:
                     rationale="PDF file not found at specified path",
                     confidence=1.0
                 )]
-                return {"evidences": state['evidences'] | evidences}
+                return {"evidences": evidences}
             
             success = self.pdf_forensics.load_pdf(state['pdf_path'])
             
@@ -222,7 +325,7 @@ class DocAnalyst:
                     rationale="Failed to parse PDF file",
                     confidence=1.0
                 )]
-                return {"evidences": state['evidences'] | evidences}
+                return {"evidences": evidences}
             
             # 1. Theoretical Depth Analysis
             key_terms = [
@@ -242,7 +345,7 @@ class DocAnalyst:
                 theoretical_evidence.append(Evidence(
                     goal="Verify theoretical depth and concept understanding",
                     found=True,
-                    content=json.dumps(contexts[:2], indent=2),  # First 2 contexts
+                    content=_json(contexts[:2]),  # First 2 contexts
                     location=f"PDF Report, page {contexts[0]['page'] if contexts else 'unknown'}",
                     rationale=f"Found discussion of '{term}' with proper context",
                     confidence=0.85 if contexts else 0.5
@@ -262,42 +365,23 @@ class DocAnalyst:
             
             evidences['theoretical_depth'] = theoretical_evidence
             
-            # 2. Cross-Reference Claims
-            # Extract potential file path claims from PDF
-            claims = []
-            for chunk in self.pdf_forensics.chunks:
-                # Look for file path patterns
-                words = chunk['text'].split()
-                for word in words:
-                    if '.py' in word or '/' in word and '.' in word:
-                        claims.append(word.strip('.,;:()'))
-            
-            # Verify claims against repo evidence
-            verified_claims = []
-            for claim in list(set(claims))[:10]:  # Limit to 10 claims
-                # Check if claim exists in repo evidence
-                found_in_repo = False
-                for evidence_list in state['evidences'].values():
-                    for evidence in evidence_list:
-                        if evidence.location and claim in evidence.location:
-                            found_in_repo = True
-                            break
-                
-                verified_claims.append({
-                    'claim': claim,
-                    'verified': found_in_repo,
-                    'source': 'PDF'
-                })
-            
-            evidences['cross_reference'] = [Evidence(
-                goal="Cross-reference PDF claims with repository evidence",
-                found=any(vc['verified'] for vc in verified_claims),
-                content=json.dumps(verified_claims, indent=2),
-                location="PDF Report cross-reference",
-                rationale=f"Verified {sum(1 for vc in verified_claims if vc['verified'])} out of {len(verified_claims)} claims",
+            # 2. Extract file-path claims for later cross-referencing.
+            # Verification against repo evidence happens at the aggregator
+            # fan-in, so this branch never has to wait for the clone.
+            # One compiled-regex pass over the joined text replaces the
+            # per-word Python scan (whose '.py in w or / in w and . in w'
+            # precedence also admitted bare slashes as claims)
+            text_blob = ' '.join(self.pdf_forensics.iter_chunk_texts())
+            unique_claims = sorted(set(_PATH_RE.findall(text_blob)))[:10]  # Limit to 10 claims
+            evidences['pdf_claims'] = [Evidence(
+                goal="Extract file path claims from PDF for cross-referencing",
+                found=len(unique_claims) > 0,
+                content=_json(unique_claims),
+                location="PDF Report",
+                rationale=f"Extracted {len(unique_claims)} file path claims for verification against repository evidence",
                 confidence=0.8
             )]
-            
+
         except Exception as e:
             evidences['error'] = [Evidence(
                 goal="Handle document analysis errors",
@@ -307,25 +391,38 @@ class DocAnalyst:
                 rationale=f"Analysis failed with error: {str(e)}",
                 confidence=1.0
             )]
-        
-        return {"evidences": state['evidences'] | evidences}
+
+        if 'error' not in evidences:
+            evidence_cache.save_evidence(cache_id, evidences)
+
+        return {"evidences": evidences}
 
 
 class VisionInspector:
     """Diagram detective - analyzes architectural diagrams in PDF"""
-    
-    def __init__(self):
-        self.vision = VisionForensics()
+
+    def __init__(self, http_client=None):
+        self.vision = VisionForensics(http_client=http_client)
         self.pdf_forensics = PDFForensics()
     
     def __call__(self, state: AgentState) -> Dict[str, Any]:
         """Execute forensic analysis on diagrams"""
         evidences = {}
-        
+
+        # Diagram analysis is the expensive vision LLM path - cache by PDF digest
+        cache_id = evidence_cache.cache_key(
+            'vision_inspector', evidence_cache.file_sha256(state['pdf_path'])
+        )
+        cached = evidence_cache.load_evidence(cache_id)
+        if cached is not None:
+            logger.info("VisionInspector cache hit - skipping diagram analysis")
+            return {"evidences": cached}
+
         try:
-            # Extract images from PDF
-            images = self.pdf_forensics.extract_images(state['pdf_path'])
-            
+            # Extract images from PDF - only as many as we will analyze,
+            # so extraction stops before rasterizing unused images
+            images = self.pdf_forensics.extract_images(state['pdf_path'], max_images=3)
+
             if not images:
                 evidences['diagrams'] = [Evidence(
                     goal="Analyze architectural diagrams",
@@ -335,34 +432,42 @@ class VisionInspector:
                     rationale="No images found in PDF for diagram analysis",
                     confidence=1.0
                 )]
-                return {"evidences": state['evidences'] | evidences}
+                return {"evidences": evidences}
             
-            # Analyze each diagram
+            # Analyze the diagrams as one concurrent batch
+            batch = images[:3]  # First 3 diagrams
+            analyses = self.vision.analyze_diagrams(
+                [img['path'] for img in batch],
+                "Analyze this architecture diagram. Is it a LangGraph state machine showing parallel execution paths?"
+            )
+
+            # Failed analyses (missing API key, exhausted rate-limit
+            # retries) come back as {'error': ...} dicts rather than
+            # exceptions; caching those would poison the PDF-digest entry
+            # for every future run of the same PDF
+            analysis_failed = any('error' in analysis for analysis in analyses)
+
             diagram_evidence = []
-            for img in images[:3]:  # Analyze first 3 diagrams
-                analysis = self.vision.analyze_diagram(
-                    img['path'],
-                    "Analyze this architecture diagram. Is it a LangGraph state machine showing parallel execution paths?"
-                )
-                
+            for img, analysis in zip(batch, analyses):
                 diagram_evidence.append(Evidence(
                     goal="Analyze architectural diagrams for swarm visualization",
                     found=True,
-                    content=json.dumps(analysis, indent=2),
+                    content=_json(analysis),
                     location=f"PDF Report, page {img['page']}",
                     rationale=f"Diagram type: {analysis.get('diagram_type', 'Unknown')}. Parallel detected: {analysis.get('parallel_detected', False)}",
                     confidence=0.75
                 ))
-                
+
                 # Cleanup temp file
                 try:
                     os.unlink(img['path'])
                 except:
                     pass
-            
+
             evidences['diagrams'] = diagram_evidence
             
         except Exception as e:
+            analysis_failed = True
             evidences['error'] = [Evidence(
                 goal="Handle vision analysis errors",
                 found=False,
@@ -371,5 +476,8 @@ class VisionInspector:
                 rationale=f"Analysis failed with error: {str(e)}",
                 confidence=1.0
             )]
-        
-        return {"evidences": state['evidences'] | evidences}
\ No newline at end of file
+
+        if 'error' not in evidences and not analysis_failed:
+            evidence_cache.save_evidence(cache_id, evidences)
+
+        return {"evidences": evidences}
\ No newline at end of file
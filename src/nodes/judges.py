@@ -4,19 +4,53 @@ Each judge analyzes the SAME evidence but from different philosophical lenses.
 Uses .with_structured_output() for guaranteed JSON output.
 """
 
-import json
 from typing import Dict, List, Any, Optional, Type
-from groq import Groq
+from concurrent.futures import ThreadPoolExecutor
+from groq import Groq, GroqError
 import os
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 import logging
 from dotenv import load_dotenv
 
 from src.state import AgentState, JudicialOpinion, RubricDimension
+from src.utils.backoff import completion_with_backoff
+from src.utils.evidence_cache import cache_key, load_opinion, save_opinion
 
 logger = logging.getLogger(__name__)
 load_dotenv()  # Load environment variables from .env file
 
+_JUDGE_MODELS = {
+    "full": "llama-3.3-70b-versatile",  # accuracy baseline
+    "specdec": "llama-3.3-70b-specdec", # speculative-decoding preview - opt-in only
+    "fast": "llama-3.1-8b-instant",     # ~an order of magnitude cheaper/faster
+}
+
+
+def _judge_model() -> str:
+    """
+    Resolve the serving tier for the judge model. "full" is the default
+    and the only tier guaranteed servable; JUDGE_MODEL_TIER=fast or
+    =specdec opts a deployment into a cheaper/faster tier, and unsetting
+    the variable is the rollback path. Unknown values fall back to the
+    baseline rather than failing the audit.
+    """
+    tier = os.environ.get("JUDGE_MODEL_TIER", "full").lower()
+    if tier not in _JUDGE_MODELS:
+        logger.warning(f"Unknown JUDGE_MODEL_TIER '{tier}' - using 'full'")
+        tier = "full"
+    return _JUDGE_MODELS[tier]
+
+
+# Code dimensions draw long architectural arguments; documentation-style
+# dimensions stay short. Binning the completion budget keeps one verbose
+# dimension from stretching the tail of the whole judge batch
+def _max_tokens_for(dimension: RubricDimension) -> int:
+    """Completion budget bin for a dimension's expected argument length"""
+    # Derived from the dimension itself rather than a hardcoded id set,
+    # so rubrics other than the default one keep sane budgets
+    return 1024 if dimension.target_artifact == "github_repo" else 512
+
+
 class JudgeOutput(BaseModel):
     """Structured output model for all judges"""
     score: int = Field(ge=1, le=5, description="Score from 1-5")
@@ -25,12 +59,250 @@ class JudgeOutput(BaseModel):
     dissent_notes: Optional[str] = Field(default=None, description="Points of disagreement")
 
 
+# Constrained decoding: the sampler can only emit tokens that satisfy the
+# schema, which removes the parse-retry failure mode of free-form "please
+# return JSON" prompting. The schema is written out by hand because strict
+# mode rejects what model_json_schema() emits: every property must be
+# listed in required, additionalProperties must be False, and
+# minimum/maximum/default/anyOf are unsupported - the 1-5 score bound is
+# enforced by JudgeOutput validation after decoding
+_JUDGE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "judge_opinion",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "score": {
+                    "type": "integer",
+                    "description": "Score from 1-5",
+                },
+                "argument": {
+                    "type": "string",
+                    "description": "Detailed reasoning for the score",
+                },
+                "cited_evidence": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "References to evidence locations",
+                },
+                "dissent_notes": {
+                    "type": ["string", "null"],
+                    "description": "Points of disagreement",
+                },
+            },
+            "required": ["score", "argument", "cited_evidence", "dissent_notes"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def _judge_completion(client: Groq, dimension: RubricDimension, **kwargs):
+    """
+    Judge completion at the dimension's budget bin, retried once at the
+    full budget on length truncation. A completion cut off mid-JSON fails
+    validation and would otherwise surface as a fabricated fallback
+    opinion, so the small bin must never be the reason a verdict is lost.
+    """
+    budget = _max_tokens_for(dimension)
+    response = completion_with_backoff(client, max_tokens=budget, **kwargs)
+    if response.choices[0].finish_reason == "length" and budget < 1024:
+        logger.info(f"Judge reply for '{dimension.id}' truncated at {budget} tokens - retrying at 1024")
+        response = completion_with_backoff(client, max_tokens=1024, **kwargs)
+    return response
+
+
+def _evidence_to_dict(evidence) -> Dict:
+    """Convert an Evidence object to a plain dict for prompt embedding"""
+    if hasattr(evidence, 'model_dump'):
+        return evidence.model_dump()
+    return {
+        'goal': getattr(evidence, 'goal', ''),
+        'found': getattr(evidence, 'found', False),
+        'location': getattr(evidence, 'location', ''),
+        'rationale': getattr(evidence, 'rationale', ''),
+        'confidence': getattr(evidence, 'confidence', 0.0)
+    }
+
+
+def collect_all_evidence(evidences: Dict) -> List[Dict]:
+    """Collect every evidence item across detective types into one list"""
+    return [
+        {'type': key, 'evidence': _evidence_to_dict(e)}
+        for key, evidence_list in evidences.items()
+        for e in evidence_list
+    ]
+
+
+def compact_evidence(evidence_list: List[Dict], max_per_type: int = 5,
+                     max_field_chars: int = 240) -> List[Dict]:
+    """
+    Deterministic digest of the evidence for judge prompts: caps items per
+    detective type and trims long text fields. Judges only need the finding,
+    its location and the reasoning headline - the untrimmed records stay in
+    state for the Chief Justice's fact checks. Prefill tokens are the cost
+    driver on the judge hot path, and this digest is what gets embedded
+    three times per dimension.
+    """
+    per_type = {}
+    compacted = []
+
+    for item in evidence_list:
+        count = per_type.get(item['type'], 0)
+        if count >= max_per_type:
+            continue
+        per_type[item['type']] = count + 1
+
+        e = dict(item['evidence'])
+        for field in ('goal', 'rationale', 'location'):
+            value = str(e.get(field, ''))
+            if len(value) > max_field_chars:
+                e[field] = value[:max_field_chars] + '...'
+        compacted.append({'type': item['type'], 'evidence': e})
+
+    return compacted
+
+
+def format_evidence(evidence_list: List) -> str:
+    """Neutral evidence formatting shared byte-for-byte by all personas"""
+    if not evidence_list:
+        return "NO EVIDENCE FOUND for this dimension."
+
+    lines = []
+    for item in evidence_list:
+        e = item['evidence']
+        lines.append(f"Type: {item['type']}")
+        lines.append(f"Goal: {e.get('goal', 'N/A')}")
+        lines.append(f"Found: {e.get('found', False)}")
+        lines.append(f"Location: {e.get('location', 'N/A')}")
+        lines.append(f"Rationale: {e.get('rationale', 'N/A')}")
+        lines.append(f"Confidence: {e.get('confidence', 0)}")
+        lines.append("---")
+
+    return "\n".join(lines)
+
+
+def build_shared_context(dimension: RubricDimension, evidence_text: str) -> str:
+    """
+    Invariant leading block for a judge call. Keeping this byte-identical
+    across the three personas of one dimension means provider prompt caches
+    only pay for the (large) evidence prefill once; the persona-specific
+    wording lives in the short trailing user message.
+    """
+    return f"""You are a judge in a digital courtroom for code review. Respond in JSON format.
+
+Dimension being judged: {dimension.name}
+
+Evidence collected by detectives:
+{evidence_text}"""
+
+
+def _insufficient_evidence_opinion(judge: str, dimension: RubricDimension) -> JudicialOpinion:
+    """Deterministic verdict for a run whose evidence carries no signal"""
+    return JudicialOpinion(
+        judge=judge,
+        criterion_id=dimension.id,
+        score=1,
+        argument="No usable evidence was collected for this dimension. "
+                 "Without artifacts to weigh, the score defaults to 1.",
+        cited_evidence=[],
+        dissent_notes="Deterministic verdict - LLM review skipped for lack of evidence"
+    )
+
+
+class JudicialBench:
+    """
+    Batches all (judge, dimension) opinion requests into one dispatch.
+    Groq has no server-side batch endpoint, so the batching happens at the
+    client: every request is put in flight at once over a thread pool, which
+    amortizes the shared evidence context across the three personas instead
+    of paying three sequential rounds per dimension.
+    """
+
+    def __init__(self, prosecutor: 'Prosecutor', defense: 'Defense', tech_lead: 'TechLead',
+                 max_workers: int = 8):
+        self.prosecutor = prosecutor
+        self.defense = defense
+        self.tech_lead = tech_lead
+        self.max_workers = max_workers
+
+    def __call__(self, state: AgentState) -> Dict[str, Any]:
+        """Dispatch all judge opinions concurrently and merge the results"""
+        opinions = []
+        for _, dimension_opinions in self.iter_dimension_opinions(state):
+            opinions.extend(dimension_opinions)
+
+        return {"opinions": state['opinions'] + opinions}
+
+    def iter_dimension_opinions(self, state: AgentState):
+        """
+        Yield (dimension, opinions) as each dimension's bench completes.
+        All judge calls go in flight immediately; yielding per dimension lets
+        the caller start synthesizing one criterion's verdict while judges for
+        the remaining criteria are still decoding.
+        """
+        # Compact and format the evidence block once; every persona call for
+        # a given dimension leads with the exact same bytes so the provider's
+        # prompt cache serves the prefill for two of the three calls
+        evidence_list = compact_evidence(collect_all_evidence(state['evidences']))
+        evidence_text = format_evidence(evidence_list)
+
+        # Screen before the expensive calls: with no evidence (or nothing
+        # above noise confidence) every persona's verdict is predetermined,
+        # so emit it deterministically instead of paying 3 x num_criteria
+        # LLM round-trips to learn that nothing was found
+        max_confidence = max(
+            (item['evidence'].get('confidence', 0.0) for item in evidence_list),
+            default=0.0
+        )
+        if not evidence_list or max_confidence < 0.05:
+            for dimension in state['rubric_dimensions']:
+                yield dimension, [
+                    _insufficient_evidence_opinion(judge, dimension)
+                    for judge in ('Prosecutor', 'Defense', 'TechLead')
+                    if not (judge == 'Prosecutor' and dimension.target_artifact != "github_repo")
+                ]
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Longest-first submission: when calls queue behind the pool, the
+            # long-form dimensions start earliest so they don't become the
+            # stragglers that set the batch makespan
+            by_budget = sorted(
+                state['rubric_dimensions'],
+                key=_max_tokens_for, reverse=True
+            )
+
+            futures_by_id = {}
+            for dimension in by_budget:
+                shared_context = build_shared_context(dimension, evidence_text)
+                futures = []
+                for judge in (self.prosecutor, self.defense, self.tech_lead):
+                    # Prosecutor only judges code artifacts
+                    if judge is self.prosecutor and dimension.target_artifact != "github_repo":
+                        continue
+                    futures.append(executor.submit(
+                        judge._get_opinion, dimension, evidence_list, shared_context
+                    ))
+                futures_by_id[dimension.id] = futures
+
+            for dimension in state['rubric_dimensions']:
+                futures = futures_by_id[dimension.id]
+                yield dimension, [f.result() for f in futures if f.result()]
+
+
 class Prosecutor:
     """The Critical Lens - 'Trust No One. Assume Vibe Coding.'"""
     
-    def __init__(self, api_key: Optional[str] = None):
-        self.client = Groq(api_key=api_key or os.environ.get("GROQ_API_KEY"))
-        self.model = "llama-3.3-70b-versatile"
+    def __init__(self, api_key: Optional[str] = None, http_client=None):
+        # http_client lets the orchestrator share one keep-alive connection
+        # pool across all three personas instead of paying a TLS handshake
+        # per judge client
+        self.client = Groq(api_key=api_key or os.environ.get("GROQ_API_KEY"),
+                           http_client=http_client)
+        self.model = _judge_model()
         
         # Distinct system prompt for Prosecutor
         self.system_prompt = """You are the PROSECUTOR in a digital courtroom for code review.
@@ -122,20 +394,20 @@ Remember: You are the PROSECUTOR. Finding flaws is your ONLY job."""
         
         return "\n".join(lines)
     
-    def _get_opinion(self, dimension: RubricDimension, evidence_list: List) -> JudicialOpinion:
+    def _get_opinion(self, dimension: RubricDimension, evidence_list: List,
+                     shared_context: Optional[str] = None) -> JudicialOpinion:
         """Get structured opinion from LLM with prosecutor lens using .with_structured_output()"""
-        
-        evidence_text = self._format_evidence(evidence_list)
-        
-        # Create the prompt
-        user_prompt = f"""Dimension being judged: {dimension.name}
+
+        # Large invariant block first (prompt-prefix cache friendly), short
+        # persona-specific suffix last
+        if shared_context is None:
+            shared_context = build_shared_context(dimension, self._format_evidence(evidence_list))
+
+        user_prompt = f"""{self.system_prompt}
 
 Prosecutor's guidelines for this dimension:
 {dimension.judicial_logic.get('prosecutor', 'Be harsh and critical')}
 
-Evidence collected by detectives:
-{evidence_text}
-
 Analyze the evidence through your critical PROSECUTOR lens.
 Look SPECIFICALLY for:
 - Missing requirements (score 1)
@@ -144,45 +416,59 @@ Look SPECIFICALLY for:
 - Hallucinations (score 1)
 - Free text instead of structured output (score 1-2)
 
-Return a structured assessment with:
+Return a structured JSON assessment with:
 - score: 1-5 (be harsh - 1 for major violations)
 - argument: detailed explanation of violations found
 - cited_evidence: list of specific locations where violations were found
 - dissent_notes: why you disagree with any potential leniency
 
 Remember: You are the PROSECUTOR. Finding flaws is your only job."""
-        
+
+        # Exact-match cache: at temperature 0 the opinion is a pure function
+        # of (persona, model, prompt bytes), so byte-identical evidence on a
+        # re-run skips the LLM round-trip entirely
+        opinion_key = cache_key("Prosecutor", self.model, dimension.id,
+                                shared_context, user_prompt)
+        cached = load_opinion(opinion_key)
+        if cached is not None:
+            return cached
+
         try:
             # Use with_structured_output pattern via response_format
-            response = self.client.chat.completions.create(
+            response = _judge_completion(
+                self.client,
+                dimension,
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": f"{self.system_prompt} in JSON format."},
+                    {"role": "system", "content": shared_context},
                     {"role": "user", "content": user_prompt}
                 ],
-                temperature=0.1,  # Low temp for consistency
-                max_tokens=1024,
-                response_format={"type": "json_object"}  # Force JSON output
+                temperature=0.0,  # Deterministic structural tokens maximize draft accepts
+                response_format=_JUDGE_RESPONSE_FORMAT
             )
             
-            result = json.loads(response.choices[0].message.content)
-            
-            # Ensure result has all required fields
-            score = result.get('score', 1)
+            result = JudgeOutput.model_validate_json(response.choices[0].message.content)
+
+            score = result.score
             if score > 3:  # Prosecutor should be harsh
                 score = max(1, score - 1)  # Reduce score if too generous
-            
-            return JudicialOpinion(
+
+            opinion = JudicialOpinion(
                 judge="Prosecutor",
                 criterion_id=dimension.id,
                 score=score,
-                argument=result.get('argument', 'No argument provided - this is a violation itself!'),
-                cited_evidence=result.get('cited_evidence', []),
-                dissent_notes=result.get('dissent_notes', 'Found major violations in implementation')
+                argument=result.argument,
+                cited_evidence=result.cited_evidence,
+                dissent_notes=result.dissent_notes or 'Found major violations in implementation'
             )
-            
-        except Exception as e:
-            logger.exception(f"Prosecutor LLM call failed: {e}")
+            save_opinion(opinion_key, opinion)
+            return opinion
+
+
+        except (GroqError, ValidationError) as e:
+            # Narrow catch: API/transport failures and schema violations get
+            # the persona fallback; genuine bugs propagate to the caller
+            logger.exception("Prosecutor LLM call failed")
             # Fallback opinion with harsh score
             return JudicialOpinion(
                 judge="Prosecutor",
@@ -197,9 +483,13 @@ Remember: You are the PROSECUTOR. Finding flaws is your only job."""
 class Defense:
     """The Optimistic Lens - 'Reward Effort and Intent'"""
     
-    def __init__(self, api_key: Optional[str] = None):
-        self.client = Groq(api_key=api_key or os.environ.get("GROQ_API_KEY"))
-        self.model = "llama-3.3-70b-versatile"
+    def __init__(self, api_key: Optional[str] = None, http_client=None):
+        # http_client lets the orchestrator share one keep-alive connection
+        # pool across all three personas instead of paying a TLS handshake
+        # per judge client
+        self.client = Groq(api_key=api_key or os.environ.get("GROQ_API_KEY"),
+                           http_client=http_client)
+        self.model = _judge_model()
         
         # Distinct system prompt for Defense
         self.system_prompt = """You are the DEFENSE ATTORNEY in a digital courtroom for code review.
@@ -288,19 +578,18 @@ Remember: You are the DEFENSE. Finding the good in their work is your only job."
         
         return "\n".join(lines)
     
-    def _get_opinion(self, dimension: RubricDimension, evidence_list: List) -> JudicialOpinion:
+    def _get_opinion(self, dimension: RubricDimension, evidence_list: List,
+                     shared_context: Optional[str] = None) -> JudicialOpinion:
         """Get structured opinion from LLM with defense lens using .with_structured_output()"""
-        
-        evidence_text = self._format_evidence(evidence_list)
-        
-        user_prompt = f"""Dimension being judged: {dimension.name}
+
+        if shared_context is None:
+            shared_context = build_shared_context(dimension, self._format_evidence(evidence_list))
+
+        user_prompt = f"""{self.system_prompt}
 
 Defense's guidelines for this dimension:
 {dimension.judicial_logic.get('defense', 'Be generous and look for effort')}
 
-Evidence collected by detectives:
-{evidence_text}
-
 Analyze the evidence through your OPTIMISTIC DEFENSE lens.
 Look SPECIFICALLY for:
 - Creative problem-solving (score 4-5)
@@ -309,44 +598,55 @@ Look SPECIFICALLY for:
 - Deep conceptual alignment (score 5)
 - Effort indicators (score 4-5)
 
-Return a structured assessment with:
+Return a structured JSON assessment with:
 - score: 1-5 (be generous - 4-5 for effort and understanding)
 - argument: detailed explanation of strengths found
 - cited_evidence: list of locations showing effort/understanding
 - dissent_notes: why you disagree with the prosecution's harsh assessment
 
 Remember: You are the DEFENSE. Finding the good in their work is your only job."""
-        
+
+        # Exact-match cache (see Prosecutor): identical prompt bytes at
+        # temperature 0 make the LLM call skippable on re-runs
+        opinion_key = cache_key("Defense", self.model, dimension.id,
+                                shared_context, user_prompt)
+        cached = load_opinion(opinion_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.client.chat.completions.create(
+            response = _judge_completion(
+                self.client,
+                dimension,
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": f"{self.system_prompt} in JSON format."},
+                    {"role": "system", "content": shared_context},
                     {"role": "user", "content": user_prompt}
                 ],
-                temperature=0.2,
-                max_tokens=1024,
-                response_format={"type": "json_object"}
+                temperature=0.0,
+                response_format=_JUDGE_RESPONSE_FORMAT
             )
             
-            result = json.loads(response.choices[0].message.content)
-            
-            # Ensure result has all required fields
-            score = result.get('score', 3)
+            result = JudgeOutput.model_validate_json(response.choices[0].message.content)
+
+            score = result.score
             if score < 3:  # Defense should be generous
                 score = min(5, score + 1)  # Increase score if too harsh
-            
-            return JudicialOpinion(
+
+            opinion = JudicialOpinion(
                 judge="Defense",
                 criterion_id=dimension.id,
                 score=score,
-                argument=result.get('argument', 'Student showed good effort and understanding'),
-                cited_evidence=result.get('cited_evidence', []),
-                dissent_notes=result.get('dissent_notes', 'Student demonstrated effort and deserves credit')
+                argument=result.argument,
+                cited_evidence=result.cited_evidence,
+                dissent_notes=result.dissent_notes or 'Student demonstrated effort and deserves credit'
             )
-            
-        except Exception as e:
-            logger.exception(f"Defense LLM call failed: {e}")
+            save_opinion(opinion_key, opinion)
+            return opinion
+
+
+        except (GroqError, ValidationError) as e:
+            logger.exception("Defense LLM call failed")
             return JudicialOpinion(
                 judge="Defense",
                 criterion_id=dimension.id,
@@ -360,9 +660,13 @@ Remember: You are the DEFENSE. Finding the good in their work is your only job."
 class TechLead:
     """The Pragmatic Lens - 'Does it actually work? Is it maintainable?'"""
     
-    def __init__(self, api_key: Optional[str] = None):
-        self.client = Groq(api_key=api_key or os.environ.get("GROQ_API_KEY"))
-        self.model = "llama-3.3-70b-versatile"
+    def __init__(self, api_key: Optional[str] = None, http_client=None):
+        # http_client lets the orchestrator share one keep-alive connection
+        # pool across all three personas instead of paying a TLS handshake
+        # per judge client
+        self.client = Groq(api_key=api_key or os.environ.get("GROQ_API_KEY"),
+                           http_client=http_client)
+        self.model = _judge_model()
         
         # Distinct system prompt for Tech Lead
         self.system_prompt = """You are the TECH LEAD in a digital courtroom for code review.
@@ -476,19 +780,18 @@ Remember: You are the TECH LEAD. Being pragmatic and realistic is your only job.
         
         return "\n".join(lines)
     
-    def _get_opinion(self, dimension: RubricDimension, evidence_list: List) -> JudicialOpinion:
+    def _get_opinion(self, dimension: RubricDimension, evidence_list: List,
+                     shared_context: Optional[str] = None) -> JudicialOpinion:
         """Get structured opinion from LLM with tech lead lens using .with_structured_output()"""
-        
-        evidence_text = self._format_evidence(evidence_list)
-        
-        user_prompt = f"""Dimension being judged: {dimension.name}
+
+        if shared_context is None:
+            shared_context = build_shared_context(dimension, self._format_evidence(evidence_list))
+
+        user_prompt = f"""{self.system_prompt}
 
 Tech Lead's guidelines for this dimension:
 {dimension.judicial_logic.get('tech_lead', 'Be pragmatic and realistic')}
 
-Evidence collected by detectives:
-{evidence_text}
-
 Analyze the evidence through your PRAGMATIC TECH LEAD lens.
 Focus SPECIFICALLY on:
 - Does the code actually work? (score 1 if broken, 5 if working)
@@ -497,39 +800,51 @@ Focus SPECIFICALLY on:
 - Technical debt level (score 1 for high debt, 5 for clean code)
 - Production readiness (score based on error handling, security)
 
-Return a structured assessment with:
+Return a structured JSON assessment with:
 - score: 1-5 (be realistic - 1 for broken/unusable, 3 for functional but messy, 5 for production-ready)
 - argument: detailed technical assessment
 - cited_evidence: list of specific locations supporting your assessment
 - dissent_notes: your tie-breaking perspective between prosecution and defense
 
 Remember: You are the TECH LEAD. Be pragmatic and realistic about what actually works."""
-        
+
+        # Exact-match cache (see Prosecutor): identical prompt bytes at
+        # temperature 0 make the LLM call skippable on re-runs
+        opinion_key = cache_key("TechLead", self.model, dimension.id,
+                                shared_context, user_prompt)
+        cached = load_opinion(opinion_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.client.chat.completions.create(
+            response = _judge_completion(
+                self.client,
+                dimension,
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": f"{self.system_prompt} in JSON format."},
+                    {"role": "system", "content": shared_context},
                     {"role": "user", "content": user_prompt}
                 ],
-                temperature=0.1,
-                max_tokens=1024,
-                response_format={"type": "json_object"}
+                temperature=0.0,
+                response_format=_JUDGE_RESPONSE_FORMAT
             )
-            
-            result = json.loads(response.choices[0].message.content)
-            
-            return JudicialOpinion(
+
+            result = JudgeOutput.model_validate_json(response.choices[0].message.content)
+
+            opinion = JudicialOpinion(
                 judge="TechLead",
                 criterion_id=dimension.id,
-                score=result.get('score', 2),
-                argument=result.get('argument', 'Technical evaluation shows implementation issues'),
-                cited_evidence=result.get('cited_evidence', []),
-                dissent_notes=result.get('dissent_notes', 'Technical implementation has issues that need addressing')
+                score=result.score,
+                argument=result.argument,
+                cited_evidence=result.cited_evidence,
+                dissent_notes=result.dissent_notes or 'Technical implementation has issues that need addressing'
             )
-            
-        except Exception as e:
-            logger.exception(f"Tech Lead LLM call failed: {e}")
+            save_opinion(opinion_key, opinion)
+            return opinion
+
+
+        except (GroqError, ValidationError) as e:
+            logger.exception("Tech Lead LLM call failed")
             return JudicialOpinion(
                 judge="TechLead",
                 criterion_id=dimension.id,
@@ -4,12 +4,19 @@ Uses hardcoded deterministic rules, not LLM averaging.
 """
 
 import json
+import re
 from datetime import datetime
 from typing import Dict, List, Any, Tuple
 from collections import defaultdict
 
 from src.state import AgentState, JudicialOpinion, Evidence, SynthesisRule
 
+# Security-flaw patterns compiled once at import: the checks run per
+# criterion over every evidence item, so each scan should be a single
+# C-level pass, not a lowered-copy substring search in Python
+_UNSAFE_CONTENT_RE = re.compile(r'unsafe', re.IGNORECASE)
+_SHELL_INJECTION_RE = re.compile(r'os\.system')
+
 
 class ChiefJustice:
     """
@@ -26,17 +33,17 @@ class ChiefJustice:
             if hasattr(opinion, 'criterion_id'):
                 opinions_by_criterion[opinion.criterion_id].append(opinion)
         
+        # Index dimensions once instead of re-scanning the rubric list for
+        # every criterion
+        dimensions_by_id = {d.id: d for d in state.get('rubric_dimensions', [])}
+
         # Resolve each criterion
         resolved_scores = {}
         dissents = []
-        
+
         for criterion_id, opinions in opinions_by_criterion.items():
-            # Get dimension info
-            dimension = next(
-                (d for d in state.get('rubric_dimensions', []) if d.id == criterion_id),
-                None
-            )
-            
+            dimension = dimensions_by_id.get(criterion_id)
+
             if not dimension:
                 continue
             
@@ -172,13 +179,13 @@ class ChiefJustice:
         if 'tool_safety' in evidences:
             for evidence in evidences['tool_safety']:
                 if hasattr(evidence, 'found') and not evidence.found:
-                    if hasattr(evidence, 'content') and evidence.content and 'unsafe' in str(evidence.content).lower():
+                    if hasattr(evidence, 'content') and evidence.content and _UNSAFE_CONTENT_RE.search(str(evidence.content)):
                         return f"Security flaw detected: {getattr(evidence, 'rationale', 'Unknown')}"
-        
+
         # Check for shell injection risks
         for key, evidence_list in evidences.items():
             for evidence in evidence_list:
-                if hasattr(evidence, 'location') and evidence.location and 'os.system' in str(getattr(evidence, 'content', '')):
+                if hasattr(evidence, 'location') and evidence.location and _SHELL_INJECTION_RE.search(str(getattr(evidence, 'content', ''))):
                     return f"Potential shell injection risk in {evidence.location}"
         
         return ""
@@ -6,7 +6,7 @@ All models are hashable (frozen) to prevent issues with parallel processing.
 
 from typing import Annotated, Dict, List, Literal, Optional, Any, Set
 from typing_extensions import TypedDict
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, RootModel
 import operator
 from datetime import datetime
 import uuid
@@ -63,6 +63,10 @@ class RubricDimension(BaseModel):
         return hash((self.id, self.name))
 
 
+class RubricDimensionList(RootModel[List[RubricDimension]]):
+    """Bulk validator - parses a rubric's dimension array in one pydantic-core pass"""
+
+
 class SynthesisRule(BaseModel):
     """Hardcoded rules for the Chief Justice"""
     model_config = ConfigDict(frozen=True)
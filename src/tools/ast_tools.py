@@ -5,23 +5,133 @@ Never rely on regex - use Python's AST module for structural verification.
 
 import ast
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import re
 
 
+@lru_cache(maxsize=256)
+def _parse_file_cached(file_path: str, mtime_ns: int) -> Optional[ast.AST]:
+    """
+    Parse a file into an AST once per (path, mtime). The forensic
+    protocols each walk their own candidate lists, so the same files
+    (graph.py, state.py, nodes/*.py) get requested several times per
+    run; mtime keying invalidates if a worktree is reused after edits.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        return ast.parse(content)
+    except (SyntaxError, UnicodeDecodeError) as e:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _analyze_file_cached(file_path: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Parse and run the fused analysis once per (path, mtime)"""
+    tree = _parse_file_cached(file_path, mtime_ns)
+    if tree is None:
+        return None
+    return ASTAnalyzer.analyze_all(tree)
+
+
 class ASTAnalyzer:
     """Production AST parser for code structure verification"""
-    
+
     @staticmethod
     def parse_file(file_path: str) -> Optional[ast.AST]:
-        """Safely parse Python file into AST"""
+        """Safely parse Python file into AST (served from the shared cache)"""
+        try:
+            return _parse_file_cached(file_path, os.stat(file_path).st_mtime_ns)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def analyze_file(file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        All four structural checks for a file in one parse and one walk,
+        cached per (path, mtime). The forensic protocols overlap on their
+        candidate files, so the fused result means each file is traversed
+        exactly once per run regardless of how many protocols ask.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return ast.parse(content)
-        except (SyntaxError, UnicodeDecodeError, FileNotFoundError) as e:
+            return _analyze_file_cached(file_path, os.stat(file_path).st_mtime_ns)
+        except FileNotFoundError:
             return None
+
+    @staticmethod
+    def analyze_all(tree: ast.AST) -> Dict[str, Any]:
+        """
+        Single fused traversal collecting every check at once: Pydantic
+        models, StateGraph wiring, structured-output calls, and unsafe
+        os.system calls. Same results as the individual find_* methods,
+        one walk over the tree instead of four.
+        """
+        results = {
+            'pydantic_models': [],
+            'stategraph': {
+                'has_stategraph': False,
+                'nodes': [],
+                'edges': [],
+                'parallel_patterns': [],
+                'linear': True
+            },
+            'structured_output': [],
+            'os_system': []
+        }
+        graph_info = results['stategraph']
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                for base in node.bases:
+                    if (isinstance(base, ast.Name) and base.id == 'BaseModel') or \
+                       (isinstance(base, ast.Attribute) and base.attr == 'BaseModel'):
+                        results['pydantic_models'].append({
+                            'name': node.name,
+                            'line': node.lineno,
+                            'fields': ASTAnalyzer._extract_class_fields(node)
+                        })
+
+            elif isinstance(node, ast.Call):
+                func = node.func
+                if isinstance(func, ast.Name):
+                    if func.id == 'StateGraph':
+                        graph_info['has_stategraph'] = True
+                elif isinstance(func, ast.Attribute):
+                    attr = func.attr
+                    if attr == 'StateGraph':
+                        graph_info['has_stategraph'] = True
+                    elif attr == 'add_edge':
+                        if len(node.args) >= 2:
+                            graph_info['edges'].append({
+                                'from': ast.unparse(node.args[0]),
+                                'to': ast.unparse(node.args[1]),
+                                'line': node.lineno
+                            })
+                    elif attr == 'add_conditional_edges':
+                        graph_info['parallel_patterns'].append('conditional')
+                    elif attr in ('with_structured_output', 'bind_tools'):
+                        results['structured_output'].append({
+                            'method': attr,
+                            'line': node.lineno,
+                            'context': ast.unparse(node)[:100]  # First 100 chars
+                        })
+                    elif attr == 'system' and isinstance(func.value, ast.Name) \
+                            and func.value.id == 'os':
+                        results['os_system'].append({
+                            'type': 'os.system',
+                            'line': node.lineno,
+                            'args': [ast.unparse(arg) for arg in node.args]
+                        })
+
+        # Analyze edge patterns for parallelism
+        sources = [e['from'] for e in graph_info['edges']]
+        if len(set(sources)) < len(sources):  # Same source appears multiple times
+            graph_info['parallel_patterns'].append('fan-out')
+            graph_info['linear'] = False
+
+        return results
     
     @staticmethod
     def find_pydantic_models(tree: ast.AST) -> List[Dict[str, Any]]:
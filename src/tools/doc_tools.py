@@ -3,7 +3,9 @@ PDF analysis tools using Docling for production-grade parsing.
 """
 
 import os
+import re
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import fitz  # PyMuPDF for image extraction
@@ -11,68 +13,96 @@ import fitz  # PyMuPDF for image extraction
 from docling.document_converter import DocumentConverter
 import json
 
+# One converter, one conversion per PDF version: DocAnalyst and
+# VisionInspector each hold their own PDFForensics, and the parallel
+# self+peer path constructs even more - without sharing, the same PDF
+# goes through Docling once per instance
+_CONVERTER: Optional[DocumentConverter] = None
+
+
+def _converter() -> DocumentConverter:
+    global _CONVERTER
+    if _CONVERTER is None:
+        _CONVERTER = DocumentConverter()
+    return _CONVERTER
+
+
+def _chunk_document(document, chunk_size: int = 1000) -> List[Dict]:
+    """Split document into semantic chunks for RAG-lite"""
+    chunks = []
+
+    if not document:
+        return chunks
+
+    # Extract text by sections
+    current_chunk = ""
+    current_page = 1
+
+    for element in document.elements:
+        # Add element text to current chunk
+        if hasattr(element, 'text'):
+            if len(current_chunk) + len(element.text) > chunk_size:
+                # Save current chunk
+                if current_chunk:
+                    chunks.append({
+                        'text': current_chunk,
+                        'page': current_page,
+                        'type': element.__class__.__name__
+                    })
+                current_chunk = element.text
+            else:
+                current_chunk += " " + element.text if current_chunk else element.text
+
+        # Update page number
+        if hasattr(element, 'page'):
+            current_page = element.page
+
+    # Add final chunk
+    if current_chunk:
+        chunks.append({
+            'text': current_chunk,
+            'page': current_page,
+            'type': 'final'
+        })
+
+    return chunks
+
+
+@lru_cache(maxsize=8)
+def _terms_pattern(terms: Tuple[str, ...]) -> re.Pattern:
+    """One case-insensitive alternation matching every term in a single pass"""
+    return re.compile("|".join(re.escape(t) for t in terms), re.IGNORECASE)
+
+
+@lru_cache(maxsize=4)
+def _parse_pdf_cached(pdf_path: str, mtime_ns: int) -> Tuple:
+    """Parse and chunk a PDF once per (path, mtime) across all instances"""
+    document = _converter().convert(pdf_path)
+    return document, _chunk_document(document)
+
 
 class PDFForensics:
     """Advanced PDF analysis with RAG-lite capabilities"""
-    
+
     def __init__(self):
-        self.parser = DocumentConverter()
         self.document = None
         self.chunks = []
-    
+
     def load_pdf(self, pdf_path: str) -> bool:
-        """Load and parse PDF document"""
+        """Load and parse PDF document (served from the shared parse cache)"""
         try:
-            # Use Docling for structured parsing
-            self.document = self.parser.convert(pdf_path)
-            
-            # Extract text chunks with metadata
-            self.chunks = self._chunk_document()
-            
+            self.document, self.chunks = _parse_pdf_cached(
+                pdf_path, os.stat(pdf_path).st_mtime_ns
+            )
             return True
         except Exception as e:
             return False
     
-    def _chunk_document(self, chunk_size: int = 1000) -> List[Dict]:
-        """Split document into semantic chunks for RAG-lite"""
-        chunks = []
-        
-        if not self.document:
-            return chunks
-        
-        # Extract text by sections
-        current_chunk = ""
-        current_page = 1
-        
-        for element in self.document.elements:
-            # Add element text to current chunk
-            if hasattr(element, 'text'):
-                if len(current_chunk) + len(element.text) > chunk_size:
-                    # Save current chunk
-                    if current_chunk:
-                        chunks.append({
-                            'text': current_chunk,
-                            'page': current_page,
-                            'type': element.__class__.__name__
-                        })
-                    current_chunk = element.text
-                else:
-                    current_chunk += " " + element.text if current_chunk else element.text
-            
-            # Update page number
-            if hasattr(element, 'page'):
-                current_page = element.page
-        
-        # Add final chunk
-        if current_chunk:
-            chunks.append({
-                'text': current_chunk,
-                'page': current_page,
-                'type': 'final'
-            })
-        
-        return chunks
-    
+    def iter_chunk_texts(self):
+        """Yield chunk texts lazily for callers that only need the text"""
+        for chunk in self.chunks:
+            yield chunk['text']
+
     def query(self, question: str, top_k: int = 3) -> List[Dict]:
         """
         RAG-lite query against document chunks.
@@ -100,21 +130,30 @@ class PDFForensics:
         
         return [chunk for score, chunk in scored_chunks[:top_k] if score > 0]
     
-    def extract_images(self, pdf_path: str) -> List[Dict]:
-        """Extract images from PDF for multimodal analysis"""
+    def extract_images(self, pdf_path: str, max_images: Optional[int] = None) -> List[Dict]:
+        """
+        Extract images from PDF for multimodal analysis.
+        Rasterization is the expensive part, so callers that only analyze
+        the first few diagrams should pass max_images to stop early
+        instead of decoding every image in the document.
+        """
         images = []
-        
+
         try:
             pdf_document = fitz.open(pdf_path)
-            
+
             for page_num in range(len(pdf_document)):
                 page = pdf_document[page_num]
                 image_list = page.get_images()
-                
+
                 for img_index, img in enumerate(image_list):
+                    if max_images is not None and len(images) >= max_images:
+                        pdf_document.close()
+                        return images
+
                     xref = img[0]
                     pix = fitz.Pixmap(pdf_document, xref)
-                    
+
                     # Save to temp file
                     with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
                         pix.save(tmp.name)
@@ -124,9 +163,9 @@ class PDFForensics:
                             'path': tmp.name,
                             'size': (pix.width, pix.height)
                         })
-                    
+
                     pix = None
-            
+
             pdf_document.close()
             
         except Exception as e:
@@ -135,24 +174,32 @@ class PDFForensics:
         return images
     
     def extract_key_terms(self, terms: List[str]) -> Dict[str, List[Dict]]:
-        """Extract specific terms with context"""
+        """
+        Extract specific terms with context.
+        Each chunk is scanned once with a multi-term alternation instead of
+        once per term, so the cost is O(text) rather than O(terms x text);
+        sentence extraction only runs for chunks that actually matched.
+        """
         results = {}
-        
-        for term in terms:
-            contexts = []
-            for chunk in self.chunks:
-                if term.lower() in chunk['text'].lower():
-                    # Extract sentence containing term
-                    sentences = chunk['text'].split('.')
-                    for sentence in sentences:
-                        if term.lower() in sentence.lower():
-                            contexts.append({
-                                'context': sentence.strip(),
-                                'page': chunk['page']
-                            })
-            if contexts:
-                results[term] = contexts
-        
+        pattern = _terms_pattern(tuple(terms))
+        canonical = {t.lower(): t for t in terms}
+
+        for chunk in self.chunks:
+            matched = {canonical[m.lower()] for m in pattern.findall(chunk['text'])}
+            if not matched:
+                continue
+
+            # Extract sentences containing each matched term
+            sentences = chunk['text'].split('.')
+            for term in matched:
+                term_lower = term.lower()
+                for sentence in sentences:
+                    if term_lower in sentence.lower():
+                        results.setdefault(term, []).append({
+                            'context': sentence.strip(),
+                            'page': chunk['page']
+                        })
+
         return results
     
     def cross_reference_claims(self, claims: List[str]) -> List[Dict]:
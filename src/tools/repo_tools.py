@@ -19,11 +19,13 @@ class GitForensics:
     def __init__(self):
         self.temp_dir = None
         self.repo_path = None
-    
+        self._all_files = None
+
     def __enter__(self):
         """Context manager for automatic cleanup"""
         self.temp_dir = tempfile.TemporaryDirectory()
         self.repo_path = self.temp_dir.name
+        self._all_files = None
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -112,23 +114,45 @@ class GitForensics:
         except Exception as e:
             return [{'error': str(e)}]
     
-    def find_files(self, pattern: str) -> List[str]:
-        """Find files matching pattern in repository"""
+    def list_files(self) -> List[str]:
+        """
+        All file paths in the worktree (relative, '/'-separated), walked
+        once per clone and cached. Every find_files call filters this
+        listing instead of re-walking the tree.
+        """
         if not self.repo_path:
             return []
-        
-        matches = []
-        for root, dirs, files in os.walk(self.repo_path):
-            # Skip .git directory
-            dirs[:] = [d for d in dirs if d != '.git']
-            
-            for file in files:
-                if pattern in file or file.endswith(pattern.replace('*', '')):
+
+        if self._all_files is None:
+            self._all_files = []
+            for root, dirs, files in os.walk(self.repo_path):
+                # Skip .git directory
+                dirs[:] = [d for d in dirs if d != '.git']
+
+                for file in files:
                     full_path = os.path.join(root, file)
                     rel_path = os.path.relpath(full_path, self.repo_path)
-                    matches.append(rel_path)
-        
-        return matches
+                    self._all_files.append(rel_path.replace(os.sep, '/'))
+
+        return self._all_files
+
+    def find_files(self, pattern: str) -> List[str]:
+        """
+        Find files matching pattern in repository. Directory patterns
+        (trailing '/') match anywhere in the relative path; other
+        patterns match against the filename.
+        """
+        if pattern.endswith('/'):
+            return [
+                f for f in self.list_files()
+                if f.startswith(pattern) or f'/{pattern}' in f
+            ]
+
+        suffix = pattern.replace('*', '')
+        return [
+            f for f in self.list_files()
+            if pattern in os.path.basename(f) or f.endswith(suffix)
+        ]
     
     def read_file(self, file_path: str) -> Optional[str]:
         """Safely read file content from repository"""
@@ -4,20 +4,29 @@ Multimodal analysis tools for diagram inspection using Groq's vision models.
 
 import base64
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from groq import Groq
 from PIL import Image
 import io
 
+from src.utils.backoff import completion_with_backoff
+
 
 class VisionForensics:
     """Diagram analysis using multimodal LLMs"""
-    
-    def __init__(self, api_key: Optional[str] = None):
-        self.client = Groq(api_key=api_key or os.getenv('GROQ_API_KEY'))
-        
-        # Use Gemini 2.0 Flash via Groq for vision
-        self.vision_model = "llama-4-scout-17b-16e-instruct"  # Groq's vision-capable model
+
+    def __init__(self, api_key: Optional[str] = None, http_client=None):
+        # http_client lets the orchestrator share one keep-alive connection
+        # pool between the vision calls and the judge personas
+        self.client = Groq(
+            api_key=api_key or os.getenv('GROQ_API_KEY'),
+            http_client=http_client
+        )
+
+        # Small dedicated VLM for diagrams - image tokens are far cheaper
+        # here than on the large text models; override via VISION_MODEL
+        self.vision_model = os.getenv('VISION_MODEL', "llama-4-scout-17b-16e-instruct")
     
     def encode_image(self, image_path: str) -> str:
         """Convert image to base64 for API"""
@@ -31,8 +40,9 @@ class VisionForensics:
         """
         try:
             base64_image = self.encode_image(image_path)
-            
-            response = self.client.chat.completions.create(
+
+            response = completion_with_backoff(
+                self.client,
                 model=self.vision_model,
                 messages=[
                     {
@@ -75,6 +85,20 @@ class VisionForensics:
                 'description': 'Analysis failed'
             }
     
+    def analyze_diagrams(self, image_paths: List[str], question: str) -> List[Dict]:
+        """
+        Analyze several diagrams as one in-flight batch. The provider has no
+        multi-image batch endpoint, so the requests go out concurrently and
+        results come back in input order.
+        """
+        if not image_paths:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(4, len(image_paths))) as pool:
+            return list(pool.map(
+                lambda path: self.analyze_diagram(path, question), image_paths
+            ))
+
     def _parse_analysis(self, content: str) -> Dict:
         """Parse LLM response into structured format"""
         lines = content.split('\n')
@@ -0,0 +1,32 @@
+"""
+Shared retry policy for Groq chat completions.
+
+The judge bench and the vision batch both put many requests in flight at
+once, so provider 429s arrive in bursts that hit several workers at the
+same moment. One helper owns the retry loop so the two call sites cannot
+drift apart.
+"""
+
+import random
+import time
+
+from groq import Groq, RateLimitError
+
+
+def completion_with_backoff(client: Groq, **kwargs):
+    """
+    Chat completion with exponential backoff and jitter on rate limits.
+    The jitter desynchronizes concurrent workers: without it, every call
+    throttled in the same burst sleeps the identical 1s/2s and retries as
+    a re-synchronized herd that trips the limiter again. Re-raises after
+    the last attempt so callers keep their own failure handling.
+    """
+    delay = 1.0
+    for attempt in range(3):
+        try:
+            return client.chat.completions.create(**kwargs)
+        except RateLimitError:
+            if attempt == 2:
+                raise
+            time.sleep(delay * (1 + random.random()))
+            delay *= 2
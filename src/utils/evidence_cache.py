@@ -0,0 +1,103 @@
+"""
+Exact-match result cache for detective nodes and judge opinions.
+
+Detective runs are deterministic for a fixed (repository commit, PDF digest)
+pair, so re-auditing unchanged artifacts can skip the clone, PDF parsing and
+vision LLM calls entirely. Judge calls are likewise deterministic at
+temperature 0 for a fixed (persona, model, dimension, prompt) tuple, so
+re-judging unchanged evidence can skip the LLM round-trip. Entries are plain
+JSON files under audits/cache/ named by a sha256 of the identifying inputs;
+a changed remote HEAD, PDF hash or prompt yields a different key, which is
+the whole invalidation strategy.
+"""
+
+import hashlib
+import json
+import logging
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.state import Evidence, JudicialOpinion
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path("audits/cache")
+
+
+def file_sha256(path: str) -> str:
+    """Digest a file's contents (empty string if unreadable)"""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def remote_head(repo_url: str) -> str:
+    """Resolve the remote HEAD commit SHA without cloning"""
+    try:
+        output = subprocess.run(
+            ['git', 'ls-remote', repo_url, 'HEAD'],
+            capture_output=True, text=True, timeout=30, check=True
+        ).stdout.split()
+        return output[0] if output else ""
+    except Exception:
+        # Offline or unreachable remote - key degrades to the URL alone
+        return ""
+
+
+def cache_key(*parts: str) -> str:
+    """Stable cache key from the identifying input digests"""
+    return hashlib.sha256("||".join(parts).encode('utf-8')).hexdigest()
+
+
+def load_evidence(key: str) -> Optional[Dict[str, List[Evidence]]]:
+    """Return cached evidence for this key, or None on miss/corruption"""
+    path = CACHE_DIR / f"{key}.json"
+    if not path.exists():
+        return None
+
+    try:
+        raw = json.loads(path.read_bytes())
+        return {
+            group: [Evidence(**item) for item in items]
+            for group, items in raw.items()
+        }
+    except Exception:
+        logger.warning(f"Discarding unreadable evidence cache entry: {path}")
+        return None
+
+
+def save_evidence(key: str, evidences: Dict[str, List[Evidence]]) -> None:
+    """Persist detective evidence for exact-match reuse on re-runs"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    serializable = {
+        group: [e.model_dump() if hasattr(e, 'model_dump') else str(e) for e in items]
+        for group, items in evidences.items()
+    }
+
+    path = CACHE_DIR / f"{key}.json"
+    path.write_text(json.dumps(serializable, indent=2, default=str), encoding='utf-8')
+
+
+def load_opinion(key: str) -> Optional[JudicialOpinion]:
+    """Return the cached judge opinion for this key, or None on miss"""
+    path = CACHE_DIR / f"opinion-{key}.json"
+    if not path.exists():
+        return None
+
+    try:
+        return JudicialOpinion(**json.loads(path.read_bytes()))
+    except Exception:
+        logger.warning(f"Discarding unreadable opinion cache entry: {path}")
+        return None
+
+
+def save_opinion(key: str, opinion: JudicialOpinion) -> None:
+    """Persist a successful judge opinion for exact-match reuse on re-runs"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    path = CACHE_DIR / f"opinion-{key}.json"
+    path.write_text(json.dumps(opinion.model_dump(), indent=2, default=str),
+                    encoding='utf-8')